@@ -0,0 +1,93 @@
+import argparse
+import json
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from cabina.errors import EnvParseError
+
+__all__ = ("Case", "case", "main",)
+
+Case = Tuple[str, Callable[[], Any]]
+
+
+def case(name: str, parser: Callable[[str], Any], value: str) -> Case:
+    """
+    Create a benchmark case that applies a parser to a value.
+
+    Parse errors are expected for adversarial inputs and are swallowed.
+
+    :param name: The name of the case.
+    :param parser: The parser to measure.
+    :param value: The input value.
+    :return: The benchmark case.
+    """
+    def run() -> Any:
+        try:
+            return parser(value)
+        except EnvParseError:
+            return None
+    return name, run
+
+
+def measure(fn: Callable[[], Any], *, number: int, repeat: int) -> float:
+    """
+    Measure the best time of a single call in nanoseconds.
+
+    :param fn: The callable to measure.
+    :param number: The number of calls per measurement.
+    :param repeat: The number of measurements.
+    :return: The best time per call in nanoseconds.
+    """
+    timings = timeit.repeat(fn, number=number, repeat=repeat)
+    return min(timings) / number * 1e9
+
+
+def main(cases: Sequence[Case], argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run benchmark cases and optionally compare them with a saved baseline.
+
+    :param cases: The benchmark cases.
+    :param argv: The command line arguments (default is `sys.argv[1:]`).
+    :return: The exit code (1 if any case regressed beyond the threshold).
+    """
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("-k", "--filter", default="", help="run cases containing substring")
+    arg_parser.add_argument("-n", "--number", type=int, default=10_000, help="calls per repeat")
+    arg_parser.add_argument("-r", "--repeat", type=int, default=5, help="number of repeats")
+    arg_parser.add_argument("--save", help="save results to a JSON file")
+    arg_parser.add_argument("--compare", help="compare results with a saved JSON file")
+    arg_parser.add_argument("--threshold", type=float, default=1.25,
+                            help="slowdown ratio reported as a regression")
+    args = arg_parser.parse_args(argv)
+
+    baseline: Dict[str, float] = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results: Dict[str, float] = {}
+    regressions: List[str] = []
+    width = max((len(name) for name, _ in cases), default=0)
+    for name, fn in cases:
+        if args.filter not in name:
+            continue
+        results[name] = elapsed = measure(fn, number=args.number, repeat=args.repeat)
+        line = f"{name:<{width}}  {elapsed:>12.1f} ns"
+        if name in baseline:
+            ratio = elapsed / baseline[name]
+            line += f"  x{ratio:.2f}"
+            if ratio > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: nocover
+    sys.exit("Run one of the bench_*.py scripts instead")
@@ -0,0 +1,107 @@
+import sys
+from enum import Enum
+from functools import partial
+
+from _runner import case, main
+
+from cabina.parsers import (
+    bool_parser,
+    in_range,
+    parse_array,
+    parse_as_is,
+    parse_bool,
+    parse_enum,
+    parse_float,
+    parse_frozenset,
+    parse_int,
+    parse_iter,
+    parse_json,
+    parse_literal,
+    parse_none,
+    parse_optional,
+    parse_path,
+    parse_str,
+    parse_timedelta,
+    parse_tuple,
+    pipe,
+)
+
+
+class Level(Enum):
+    DEBUG = "debug"
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+
+LONG = "x" * 10_000
+INTS = ",".join(str(x) for x in range(1_000))
+JSON = '{"types": ["image/png", "image/jpeg"], "limits": {"size": 1048576, "count": 10}}'
+WORDS = ",".join(f" word{x} " for x in range(1_000))
+
+CASES = [
+    case("parse_as_is", parse_as_is, "value"),
+
+    case("parse_none[lower]", parse_none, "none"),
+    case("parse_none[upper]", parse_none, "NULL"),
+    case("parse_none[mixed]", parse_none, "NuLl"),
+    case("parse_none[invalid-long]", parse_none, LONG),
+
+    case("parse_bool[lower]", parse_bool, "true"),
+    case("parse_bool[upper]", parse_bool, "FALSE"),
+    case("parse_bool[digit]", parse_bool, "0"),
+    case("parse_bool[mixed]", parse_bool, "TrUe"),
+    case("parse_bool[invalid]", parse_bool, "banana"),
+    case("parse_bool[invalid-long]", parse_bool, LONG),
+    case("bool_parser[extended]", bool_parser(true=("enabled",)), "enabled"),
+
+    case("parse_int[small]", parse_int, "8080"),
+    case("parse_int[padded]", parse_int, "  -42  "),
+    case("parse_int[base=16]", partial(parse_int, base=16), "deadbeef"),
+    case("parse_int[base=2]", partial(parse_int, base=2), "1" * 64),
+    case("parse_int[base=0]", partial(parse_int, base=0), "0x1f"),
+    case("parse_int[huge]", parse_int, "9" * 4_000),
+    case("parse_int[invalid]", parse_int, "12a"),
+    case("parse_int[invalid-long]", parse_int, LONG),
+
+    case("parse_float[simple]", parse_float, "3.14"),
+    case("parse_float[exp]", parse_float, "1e-10"),
+    case("parse_float[special]", parse_float, "nan"),
+    case("parse_float[long]", parse_float, "1." + "0" * 1_000),
+    case("parse_float[invalid]", parse_float, "3.14s"),
+
+    case("parse_str[simple]", parse_str, "banana"),
+    case("parse_str[padded]", parse_str, " " * 100 + "banana" + " " * 100),
+    case("parse_str[long]", parse_str, LONG),
+    case("parse_str[invalid]", parse_str, "   "),
+
+    case("parse_tuple[small]", parse_tuple, "a, b, c"),
+    case("parse_tuple[parens]", parse_tuple, "(a, b, c,)"),
+    case("parse_tuple[words-1k]", parse_tuple, WORDS),
+    case("parse_tuple[ints-1k]", partial(parse_tuple, subparser=parse_int), INTS),
+    case("parse_tuple[invalid-last]", partial(parse_tuple, subparser=parse_int), INTS + ",x"),
+
+    case("parse_iter[ints-1k]",
+         lambda x: sum(1 for _ in parse_iter(x, subparser=parse_int)), INTS),
+    case("parse_frozenset[words-1k]", parse_frozenset, WORDS),
+
+    case("parse_tuple[floats-1k]", partial(parse_tuple, subparser=parse_float), INTS),
+    case("parse_array[floats-1k]", parse_array, INTS),
+    case("parse_array[invalid-last]", parse_array, INTS + ",x"),
+
+    case("parse_json[object]", parse_json, JSON),
+    case("parse_json[object-frozen]", partial(parse_json, freeze=True), JSON),
+    case("parse_json[invalid]", parse_json, JSON[:-1]),
+
+    case("parse_optional[none]", parse_optional, "null"),
+    case("parse_optional[value]", partial(parse_optional, subparser=parse_int), "42"),
+    case("parse_literal", partial(parse_literal, choices=("a", "b", "c", "d")), "d"),
+    case("parse_enum[name]", partial(parse_enum, enum=Level), "ERROR"),
+    case("parse_enum[value]", partial(parse_enum, enum=Level), "error"),
+    case("parse_path", parse_path, "/var/lib/app"),
+    case("parse_timedelta", parse_timedelta, "1.5"),
+    case("pipe[port]", pipe(parse_str, parse_int, in_range(1, 65535)), " 8080 "),
+]
+
+if __name__ == "__main__":
+    sys.exit(main(CASES))
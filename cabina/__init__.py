@@ -1,13 +1,16 @@
 from ._computed import computed
 from ._core import Config, MetaBase, Section
 from ._environment import Environment
-from ._future_value import FutureValue, ValueType
+from ._future_value import FutureValue, ValueType, combine
 from ._lazy_environment import LazyEnvironment
+from ._provenance import Provenance
 from ._version import version
+from ._views import FrozenSection
 
 __version__ = version
 __all__ = ("Config", "Section", "computed", "env", "Environment", "lazy_env", "LazyEnvironment",
-           "FutureValue", "ValueType", "MetaBase",)
+           "FutureValue", "ValueType", "MetaBase", "combine", "FrozenSection",
+           "Provenance",)
 
 # type hint for PyCharm
 env: Environment = Environment()
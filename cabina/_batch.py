@@ -0,0 +1,116 @@
+import os
+from typing import Any, Callable, Dict, Mapping, Optional, Set
+
+from niltype import Nil
+
+from .errors import ConfigEnvError, EnvError, EnvKeyError, EnvParseError
+from .parsers import get_parser
+
+__all__ = ("EnvBatch", "resolve_parser",)
+
+
+def resolve_parser(parser: Any) -> Callable[[str], Any]:
+    """
+    Resolve a parser declaration into a parser callable.
+
+    Types known to the parser registry (`str`, `int`, `Optional[int]`, etc.) are replaced
+    with the corresponding parsers, any other callable is used as is.
+
+    :param parser: The parser callable or type.
+    :return: The parser callable.
+    """
+    resolved = get_parser(parser)
+    if resolved is None:
+        return parser  # type: ignore
+    return resolved
+
+
+class EnvBatch:
+    """
+    Resolves a group of environment variables in a single pass.
+
+    Variables are looked up and parsed in a single pass, in declaration order. Every error is
+    collected (in declaration order) instead of stopping at the first one.
+
+    A value (or an error) is served once per pass: asking for the same variable again
+    resolves the whole batch anew, so a re-fetch sees the current environment and raises
+    a fresh exception.
+    """
+
+    def __init__(self, environ: Mapping[str, str], parsers: Mapping[str, Any], *,
+                 prefix: str = "", defaults: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Initialize the EnvBatch with the environment mapping and the parsers to apply.
+
+        :param environ: A mapping of environment variables.
+        :param parsers: A mapping of variable names (without prefix) to parsers or builtin types.
+        :param prefix: An optional prefix to prepend to all variable names.
+        :param defaults: An optional mapping of variable names to default values.
+        """
+        self._environ = environ
+        self._parsers = parsers
+        self._prefix = prefix
+        self._defaults = defaults or {}
+        self._values: Dict[str, Any] = {}
+        self._errors: Dict[str, EnvError] = {}
+        self._served: Set[str] = set()
+        self._resolved = False
+
+    def resolve(self) -> None:
+        """
+        Look up and parse every variable of the batch, replacing the results of
+        the previous pass (if any).
+        """
+        values: Dict[str, Any] = {}
+        errors: Dict[str, EnvError] = {}
+
+        for key, parser in self._parsers.items():
+            name = self._prefix + key
+            try:
+                value = self._environ[name]
+            except KeyError:
+                default = self._defaults.get(key, Nil)
+                if default is Nil:
+                    errors[key] = EnvKeyError(f"{name!r} does not exist")
+                else:
+                    values[key] = default
+                continue
+            try:
+                values[key] = resolve_parser(parser)(value)
+            except EnvParseError as e:
+                errors[key] = e
+
+        self._values, self._errors = values, errors
+        self._served = set()
+        self._resolved = True
+
+    def values(self) -> Dict[str, Any]:
+        """
+        Resolve the batch and return all values in declaration order.
+
+        :return: A dictionary of variable names (without prefix) to parsed values.
+        :raises ConfigEnvError: If any variable is missing or cannot be parsed.
+        """
+        self.resolve()
+        if len(self._errors) > 0:
+            prefix = os.linesep + "- "
+            errors = [f"{self._prefix}{key}: {err}" for key, err in self._errors.items()]
+            raise ConfigEnvError(f"Failed to fetch:{prefix}" + prefix.join(errors))
+        return {key: self._values[key] for key in self._parsers}
+
+    def get(self, key: str) -> Any:
+        """
+        Resolve the batch (if not resolved yet or if the variable was already served by
+        the current pass) and return a single value.
+
+        :param key: The variable name (without prefix).
+        :return: The parsed value.
+        :raises EnvKeyError: If the variable is missing.
+        :raises EnvParseError: If the variable cannot be parsed.
+        """
+        if (not self._resolved) or (key in self._served):
+            self.resolve()
+        self._served.add(key)
+        if key in self._errors:
+            raise self._errors[key]
+        return self._values[key]
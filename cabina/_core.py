@@ -1,23 +1,39 @@
 import inspect
+import io
 import os
 import sys
+import time
 import warnings
+from fnmatch import fnmatchcase
+from functools import partial
+from hashlib import blake2b
 from typing import (
     Any,
+    Callable,
     Dict,
+    FrozenSet,
     ItemsView,
+    Iterable,
     Iterator,
     KeysView,
     List,
+    Literal,
+    Mapping,
     Optional,
     Tuple,
     Union,
     ValuesView,
+    get_args,
+    get_origin,
 )
+from weakref import WeakKeyDictionary
 
 from niltype import Nil, NilType
 
-from ._future_value import FutureValue
+from ._export import canonical_repr, get_env_source, json_dumps
+from ._future_value import FutureValue, get_fetch_count
+from ._provenance import DEFAULT, ENVIRONMENT, PROVENANCE, Provenance, is_secret_parser
+from ._views import FrozenSection, SectionItemsView, SectionValuesView
 from .errors import (
     ConfigAttrError,
     ConfigEnvError,
@@ -26,10 +42,17 @@ from .errors import (
     EnvKeyError,
     EnvParseError,
 )
+from .parsers import _freeze, get_parser
 
 _Section = None
 _Config = None
 
+_PATHS_CACHE: "WeakKeyDictionary[Any, Dict[str, Tuple[Any, str]]]" = WeakKeyDictionary()
+_FINGERPRINTS: "WeakKeyDictionary[Any, Tuple[int, bytes]]" = WeakKeyDictionary()
+_ENV_SOURCES: "WeakKeyDictionary[Any, Dict[str, Tuple[str, str]]]" = WeakKeyDictionary()
+_SELECT_CACHE: "WeakKeyDictionary[Any, Dict[Tuple[str, ...], Tuple[int, Tuple[Any, ...]]]]" = \
+    WeakKeyDictionary()
+
 
 def _is_dunder(name: str) -> bool:
     """
@@ -75,6 +98,101 @@ def _is_subclass(cls: Any, cls_type: Any) -> bool:
     return inspect.isclass(cls) and issubclass(cls, cls_type)
 
 
+def _match_path(path: str, patterns: Tuple[str, ...]) -> bool:
+    """
+    Check if a dotted member path matches any of the given glob patterns.
+
+    :param path: The dotted path of the member (e.g. "Db.HOST").
+    :param patterns: The glob patterns (e.g. "Db.*").
+    :return: True if the path matches any pattern, False otherwise.
+    """
+    return any(fnmatchcase(path, pattern) for pattern in patterns)
+
+
+def _as_tuple(values: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Convert an iterable of strings into a tuple, treating a single string as one value.
+
+    :param values: A string or an iterable of strings.
+    :return: A tuple of strings.
+    """
+    if isinstance(values, str):
+        return (values,)
+    return tuple(values)
+
+
+def _resolve_annotation(cls: Any, annotation: Any) -> Any:
+    """
+    Resolve a string (postponed) annotation in the module namespace of a given class.
+
+    :param cls: The class the annotation belongs to.
+    :param annotation: The annotation to resolve.
+    :return: The resolved annotation, or `Any` if it cannot be resolved.
+    """
+    if not isinstance(annotation, str):
+        return annotation
+    module = sys.modules.get(cls.__module__)
+    try:
+        return eval(annotation, vars(module) if module else {})
+    except Exception:
+        return Any
+
+
+def _is_instance(value: Any, tp: Any) -> bool:
+    """
+    Check if a given value matches a type annotation (shallowly for generic types).
+
+    :param value: The value to check.
+    :param tp: The type annotation to check against.
+    :return: True if the value matches the annotation (or it cannot be checked), False otherwise.
+    """
+    if tp is None:
+        tp = type(None)
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is Union:
+        return any(_is_instance(value, arg) for arg in args)
+    if origin is Literal:
+        return value in args
+    if origin is tuple:
+        if not isinstance(value, tuple):
+            return False
+        if len(args) == 2 and args[1] is Ellipsis:
+            return all(_is_instance(x, args[0]) for x in value)
+        return True
+    if inspect.isclass(tp):
+        if tp is float:
+            return isinstance(value, (int, float))
+        return isinstance(value, tp)
+    return True
+
+
+def _type_name(tp: Any) -> str:
+    """
+    Get a readable name of a type annotation.
+
+    :param tp: The type annotation.
+    :return: The name of the type (or the representation of a generic annotation).
+    """
+    return tp.__name__ if inspect.isclass(tp) else repr(tp)
+
+
+def _coerce(value: Any, parser: Callable[[str], Any], annotation: Any = Any) -> Any:
+    """
+    Parse a resolved value if it is a raw string, or check it against the annotation otherwise.
+
+    :param value: The resolved value.
+    :param parser: The parser to apply to a raw string value.
+    :param annotation: The annotation to check other values against.
+    :return: The (parsed) value.
+    :raises EnvParseError: If the value does not match the annotation.
+    """
+    if isinstance(value, str):
+        return parser(value)
+    if not _is_instance(value, annotation):
+        raise EnvParseError(f"Expected {_type_name(annotation)}, got {value!r}")
+    return value
+
+
 class UniqueDict(Dict[str, Any]):
     """
     Represents a dictionary that enforces unique keys within a specified namespace.
@@ -90,11 +208,16 @@ class UniqueDict(Dict[str, Any]):
         """
         super().__init__()
         self.__namespace = namespace
+        self.__lookups = PROVENANCE.lookups
+        self.provenance: Dict[str, int] = {}
 
     def __setitem__(self, key: str, value: Any) -> None:
         """
         Set a key-value pair in the dictionary, ensuring the key is unique.
 
+        If the value is the one returned by the environment lookup made right before,
+        the lookup is recorded as the provenance of the key.
+
         :param key: The key to set.
         :param value: The value to associate with the key.
         :raises ConfigError: If the key is reused within the namespace.
@@ -103,6 +226,11 @@ class UniqueDict(Dict[str, Any]):
             raise ConfigError(f"Attempted to reuse {key!r} in {self.__namespace!r}")
         super().__setitem__(key, value)
 
+        index = PROVENANCE.take(value, self.__lookups)
+        if index is not None:
+            self.provenance[key] = index
+        self.__lookups = PROVENANCE.lookups
+
 
 class MetaBase(type):
     """
@@ -136,6 +264,9 @@ class MetaBase(type):
         """
         super().__init__(name, bases, attrs)
 
+        if isinstance(attrs, UniqueDict):
+            PROVENANCE.bind(cls, attrs.provenance)
+
         for base in bases:
             if not _is_subclass(base, (_Config, _Section)):
                 raise ConfigError(f"Attempted to inherit {base!r}")
@@ -144,6 +275,8 @@ class MetaBase(type):
             cls.__frozen__ = False
             cls.__members__ = {}
 
+        annotations = attrs.get("__annotations__", {}) if _is_section(cls) else {}
+
         reserved = set(dir(cls.__class__))
         for key, val in attrs.items():
             if _is_dunder(key):
@@ -152,6 +285,12 @@ class MetaBase(type):
             if key in reserved:
                 raise ConfigError(f"Attempted to use reserved {key!r} in {name!r}")
 
+            if key in annotations:
+                inferred = cls.__infer(key, val, annotations[key])
+                if inferred is not val:
+                    val = inferred
+                    setattr(cls, key, val)
+
             if _is_subclass(val, _Section):
                 val.__frozen__ = False
                 val.__parent__ = cls
@@ -169,9 +308,122 @@ class MetaBase(type):
             else:  # pragma: no cover
                 pass
 
+        if _is_section(cls) and "__env_prefix__" in attrs:
+            cls.__map_environ(attrs["__env_prefix__"],
+                              environ=attrs.get("__environ__", os.environ),
+                              delimiter=attrs.get("__env_delimiter__", "__"))
+
         if _is_config(cls) or _is_section(cls):
             cls.__frozen__ = True
 
+    def __infer(cls, key: str, val: Any, annotation: Any) -> Any:
+        """
+        Apply the parser inferred from the annotation of a member.
+
+        Raw string values are parsed (lazy values are parsed on resolution), other values
+        are checked against the annotation. Members annotated with unsupported types are
+        left untouched.
+
+        :param key: The key of the member.
+        :param val: The value of the member.
+        :param annotation: The annotation of the member.
+        :return: The (parsed) value of the member.
+        :raises ConfigError: If the value does not match the annotation.
+        :raises EnvParseError: If the raw string value cannot be parsed.
+        """
+        annotation = _resolve_annotation(cls, annotation)
+        if annotation is str:
+            return val
+
+        parser = get_parser(annotation)
+        if parser is None:
+            return val
+
+        if is_secret_parser(parser):
+            source = get_env_source(val)
+            if source is not None:
+                PROVENANCE.redact_lazy(source[0], source[1])
+            PROVENANCE.redact(cls, key)
+
+        if isinstance(val, FutureValue):
+            val.convert(partial(_coerce, parser=parser, annotation=annotation))
+            return val
+        if isinstance(val, str):
+            return parser(val)
+        if inspect.isclass(val) or hasattr(type(val), "__get__"):
+            return val
+        if not _is_instance(val, annotation):
+            raise ConfigError(f"Attempted to assign {val!r} to {key!r} of type "
+                              f"{_type_name(annotation)} in <{cls.__get_full_name()}>")
+        return val
+
+    def __map_environ(cls, prefix: str, *, environ: Mapping[str, str], delimiter: str) -> None:
+        """
+        Fill annotated keys of the section subtree from delimited environment variable names.
+
+        Every environment variable that starts with the prefix is split once and routed to
+        the nested section and annotated parser it addresses (e.g. `APP__DB__HOST` fills
+        `Db.HOST` when the prefix is `APP__`). Class-level values are used as defaults.
+
+        :param prefix: The prefix of the environment variable names.
+        :param environ: A mapping of environment variables.
+        :param delimiter: The delimiter between section and key names.
+        :raises ConfigError: If an annotated key without a value has no parser for its type.
+        :raises ConfigEnvError: If any annotated key is missing or cannot be parsed.
+        """
+        routes: Dict[Tuple[str, ...], Tuple[Any, str, str, Callable[[str], Any]]] = {}
+        sections: List[Tuple[Any, Tuple[str, ...], str]] = [(cls, (), cls.__name__)]
+        while len(sections) > 0:
+            section, segments, path = sections.pop()
+            for key, annotation in section.__dict__.get("__annotations__", {}).items():
+                if _is_dunder(key):
+                    continue
+                parser = get_parser(_resolve_annotation(section, annotation))
+                if parser is None:
+                    if key in section.__dict__:
+                        continue  # keep the class-level value, as annotations are inferred
+                    raise ConfigError(f"Attempted to map {key!r} of unsupported type "
+                                      f"{annotation!r} in <{section.__get_full_name()}>")
+                routes[segments + (key.upper(),)] = (section, key, f"{path}.{key}", parser)
+            for key, val in section.__members__.items():
+                if _is_subclass(val, _Section):
+                    sections.append((val, segments + (key.upper(),), f"{path}.{key}"))
+
+        found: Dict[Tuple[str, ...], str] = {}
+        offset = len(prefix)
+        for name, value in environ.items():
+            if name.startswith(prefix):
+                segments = tuple(name[offset:].split(delimiter))
+                if segments in routes:
+                    found[segments] = value
+
+        errors: List[str] = []
+        for segments, (section, key, path, parser) in routes.items():
+            name = prefix + delimiter.join(segments)
+            if segments not in found:
+                if key not in section.__dict__:
+                    errors.append(f"{path}: {name!r} does not exist")
+                elif PROVENANCE.find(section, key) is None:
+                    PROVENANCE.bind(section, {key: PROVENANCE.record(name, None, DEFAULT)})
+                continue
+            try:
+                value = parser(found[segments])
+            except EnvParseError as e:
+                errors.append(f"{path}: {e}")
+                continue
+            raw = None if is_secret_parser(parser) else found[segments]
+            PROVENANCE.bind(section, {key: PROVENANCE.record(name, raw, ENVIRONMENT)})
+            frozen = section.__frozen__
+            section.__frozen__ = False
+            setattr(section, key, value)
+            section.__members__[key] = value
+            section.__frozen__ = frozen
+            _ENV_SOURCES.setdefault(section, {})[key] = (name, found[segments])
+
+        if len(errors) > 0:
+            sep = os.linesep + "- "
+            raise ConfigEnvError(f"Failed to fetch:{sep}" + sep.join(errors))
+
     def __getattribute__(cls, name: str) -> Any:
         """
         Retrieve an attribute from the class, resolving FutureValue instances if necessary.
@@ -308,8 +560,7 @@ class MetaBase(type):
 
         :return: A formatted string representing the class.
         """
-        formatted = cls.__format(name=cls.__get_full_name())
-        return os.linesep.join(formatted)
+        return os.linesep.join(cls.__format(name=cls.__get_full_name()))
 
     def __get_full_name(cls) -> str:
         """
@@ -332,27 +583,29 @@ class MetaBase(type):
         """
         return cls.__members.keys()
 
-    def values(cls) -> ValuesView[Any]:
+    def values(cls, *, resolve: bool = True) -> ValuesView[Any]:
         """
         Get the values of the class members.
 
+        Values are resolved lazily, one at a time while iterating.
+
+        :param resolve: Whether to resolve the values (default is True), otherwise raw members
+                        (e.g. `FutureValue` instances) are returned.
         :return: A view of the values.
         """
-        return {key: val for key, val in cls.items()}.values()
+        return SectionValuesView(cls, resolve=resolve)
 
-    def items(cls) -> ItemsView[str, Any]:
+    def items(cls, *, resolve: bool = True) -> ItemsView[str, Any]:
         """
         Get the items of the class members.
 
+        Values are resolved lazily, one at a time while iterating.
+
+        :param resolve: Whether to resolve the values (default is True), otherwise raw members
+                        (e.g. `FutureValue` instances) are returned.
         :return: A view of the items.
         """
-        items = {}
-        for key in cls.__members:
-            try:
-                items[key] = getattr(cls, key)
-            except Exception as e:
-                items[key] = e
-        return items.items()
+        return SectionItemsView(cls, resolve=resolve)
 
     def get(cls, key: str, default: Union[NilType, Any] = Nil) -> Any:
         """
@@ -370,61 +623,550 @@ class MetaBase(type):
                 return default
             raise
 
-    def __prefetch(cls) -> List[str]:
+    def __walk(cls, *, enter: Optional[Callable[[str, Any], bool]] = None
+               ) -> Iterator[Tuple[Any, str, str, Any]]:
         """
-        Prefetch all members of the class, resolving any dependent values.
+        Walk the members of the class and its nested sections in declaration order.
+
+        The tree is walked iteratively with an explicit stack, a section is yielded
+        before its members. Values are not resolved.
 
-        :return: A list of error messages, if any.
+        :param enter: An optional predicate called with the dotted path of a section
+                      and the section itself, deciding whether to walk its members.
+        :return: An iterator of (owner class, owner path, key, unresolved member) tuples,
+                 where the owner path is relative to the class ("" for its own members).
         """
-        errors: List[str] = []
-        for key in cls.__members:
-            try:
-                val = getattr(cls, key)
-            except (EnvKeyError, EnvParseError) as e:
-                namespace = cls.__get_full_name()
-                message = f"{namespace}.{key}: {e}"
-                errors.append(message)
+        stack: List[Tuple[Any, str, Iterator[str]]] = [(cls, "", iter(cls.__members))]
+        while stack:
+            owner, path, keys = stack[-1]
+            key = next(keys, None)
+            if key is None:
+                stack.pop()
+                continue
+
+            member = inspect.getattr_static(owner, key)
+            yield owner, path, key, member
+
+            if _is_subclass(member, (_Config, _Section)):
+                member_path = f"{path}.{key}" if path else key
+                if (enter is None) or enter(member_path, member):
+                    stack.append((member, member_path, iter(member.__members)))
+
+    def walk(cls, *, resolve: bool = False) -> Iterator[Tuple[str, str, Any]]:
+        """
+        Walk the members of the class and its nested sections lazily.
+
+        Nested sections are yielded before their members. Values are left unresolved
+        (e.g. as `FutureValue` instances) unless `resolve` is set, in which case
+        an error raised while resolving a value is yielded in its place.
+
+        :param resolve: Whether to resolve the values (default is False).
+        :return: An iterator of (path, key, value) tuples, where the path is the dotted path
+                 of the owner section relative to the class ("" for its own members).
+        """
+        for owner, path, key, member in cls.__walk():
+            if resolve:
+                try:
+                    member = getattr(owner, key)
+                except Exception as e:
+                    member = e
+            yield path, key, member
+
+    def select(cls, *keys: str) -> Tuple[Any, ...]:
+        """
+        Retrieve several members at once.
+
+        The keys are validated on the first call only, the resulting tuple is cached until
+        any lazy value is (re)fetched. Selections including computed members are not cached.
+
+        :param keys: The keys of the members.
+        :return: A tuple of the values in the order of the keys.
+        :raises ConfigKeyError: If any key does not exist in the class.
+        """
+        cache = _SELECT_CACHE.setdefault(cls, {})
+        fetch_count = get_fetch_count()
+        try:
+            cached_count, values = cache[keys]
+        except KeyError:
+            pass
+        else:
+            if cached_count == fetch_count:
+                return values
+
+        members = cls.__members
+        cacheable = True
+        for key in keys:
+            if key not in members:
+                raise ConfigKeyError(f"{key!r} does not exist in <{cls.__get_full_name()}>")
+            if hasattr(type(inspect.getattr_static(cls, key)), "__get__"):
+                cacheable = False
+
+        values = tuple(getattr(cls, key) for key in keys)
+        if cacheable:
+            cache[keys] = (get_fetch_count(), values)
+        return values
+
+    def __paths(cls) -> Dict[str, Tuple[Any, str]]:
+        """
+        Get the index of dotted member paths, built once per class.
+
+        :return: A dictionary of dotted paths to (owner class, key) pairs.
+        """
+        try:
+            return _PATHS_CACHE[cls]
+        except KeyError:
+            pass
+
+        index: Dict[str, Tuple[Any, str]] = {}
+        for owner, path, key, _ in cls.__walk():
+            index[f"{path}.{key}" if path else key] = (owner, key)
+        _PATHS_CACHE[cls] = index
+        return index
+
+    def paths(cls) -> KeysView[str]:
+        """
+        Get the dotted paths of all members of the class and its nested sections.
+
+        :return: A view of the paths (e.g. "Main", "Main.Db", "Main.Db.HOST").
+        """
+        return cls.__paths().keys()
+
+    def get_path(cls, path: str, default: Union[NilType, Any] = Nil) -> Any:
+        """
+        Retrieve a member by its dotted path, or return a default value if the path is not found.
+
+        :param path: The dotted path of the member relative to the class (e.g. "Main.Db.HOST").
+        :param default: The default value to return if the path is not found.
+        :return: The value of the member, or the default value.
+        :raises ConfigKeyError: If the path is not found and no default value is provided.
+        """
+        try:
+            owner, key = cls.__paths()[path]
+        except KeyError:
+            if default is not Nil:
+                return default
+            raise ConfigKeyError(f"{path!r} does not exist in <{cls.__get_full_name()}>") from None
+        return getattr(owner, key)
+
+    def explain(cls, path: str) -> Provenance:
+        """
+        Explain where the value of a member comes from.
+
+        Environment lookups are recorded in a side table as they happen (eager values when
+        the class is created, lazy values when they are resolved), so explaining a member
+        neither resolves it nor costs anything until it is called.
+
+        :param path: The dotted path of the member relative to the class (e.g. "Db.HOST").
+        :return: The provenance of the member: its source, the class that defines it,
+                 the environment variable name, the raw value and the resolution time.
+        :raises ConfigKeyError: If the path is not found.
+        """
+        try:
+            owner, key = cls.__paths()[path]
+        except KeyError:
+            raise ConfigKeyError(f"{path!r} does not exist in <{cls.__get_full_name()}>") from None
+
+        layer = next(base for base in owner.__mro__ if key in base.__dict__)
+        member = layer.__dict__[key]
+        if _is_subclass(member, (_Config, _Section)):
+            return Provenance(path, "section", layer.__get_full_name())
+
+        index = PROVENANCE.find(layer, key)
+        if index is None:
+            source = get_env_source(member)
+            if source is not None:
+                env, name, _ = source
+                index = PROVENANCE.find_lazy(env, name)
+                if index is None:
+                    return Provenance(path, "unresolved", layer.__get_full_name(), name)
+            elif isinstance(member, FutureValue) or hasattr(type(member), "__get__"):
+                return Provenance(path, "computed", layer.__get_full_name())
             else:
-                if _is_subclass(val, _Section):
-                    errors += val.__prefetch()
-        return errors
+                return Provenance(path, "value", layer.__get_full_name())
+
+        kind, name, raw, timestamp = PROVENANCE.describe(index)
+        return Provenance(path, kind, layer.__get_full_name(), name, raw, timestamp)
 
-    def prefetch(cls) -> None:
+    def to_dict(cls, *, flat: bool = False, resolve: bool = True) -> Dict[str, Any]:
         """
-        Prefetch all members and raise an error if any issues occur.
+        Export the members of the class and its nested sections into a dictionary.
+
+        :param flat: Whether to use dotted paths as keys (e.g. "Db.HOST") instead of
+                     nested dictionaries for sections (default is False).
+        :param resolve: Whether to resolve the values (default is True), otherwise raw members
+                        (e.g. `FutureValue` instances) are exported.
+        :return: A dictionary of the members.
+        :raises EnvError: If a value cannot be resolved.
+        """
+        result: Dict[str, Any] = {}
+        sections: Dict[str, Dict[str, Any]] = {"": result}
+        for owner, path, key, member in cls.__walk():
+            member_path = f"{path}.{key}" if path else key
+            if _is_subclass(member, (_Config, _Section)):
+                if not flat:
+                    sections[member_path] = sections[path][key] = {}
+                continue
+            value = getattr(owner, key) if resolve else member
+            if flat:
+                result[member_path] = value
+            else:
+                sections[path][key] = value
+        return result
 
-        :raises ConfigEnvError: If there are errors during prefetching.
+    def to_json(cls, stream: Any = None) -> Optional[str]:
         """
-        errors = cls.__prefetch()
-        if len(errors) > 0:
-            prefix = os.linesep + "- "
-            message = f"Failed to prefetch:{prefix}" + prefix.join(errors)
-            raise ConfigEnvError(message)
+        Export the resolved members of the class and its nested sections as JSON.
 
-    def __format(cls, *,
-                 indent: int = 0, prepend: bool = False, name: Optional[str] = None) -> List[str]:
+        The JSON is written to the stream member by member while the tree is walked.
+        Values that are not JSON types are converted (e.g. tuples and sets to arrays,
+        bytes to base64, DSNs to objects with the password masked).
+
+        :param stream: The stream to write to (default is None, i.e. return a string).
+        :return: The JSON string if no stream is given, None otherwise.
+        :raises EnvError: If a value cannot be resolved.
         """
-        Format the class into a readable string representation.
+        if stream is None:
+            buffer = io.StringIO()
+            cls.to_json(buffer)
+            return buffer.getvalue()
+
+        opened = [""]
+        stream.write("{")
+        separator = ""
+        for owner, path, key, member in cls.__walk():
+            while opened[-1] != path:
+                opened.pop()
+                stream.write("}")
+                separator = ","
+            stream.write(f"{separator}{json_dumps(key)}:")
+            if _is_subclass(member, (_Config, _Section)):
+                opened.append(f"{path}.{key}" if path else key)
+                stream.write("{")
+                separator = ""
+            else:
+                stream.write(json_dumps(getattr(owner, key)))
+                separator = ","
+        stream.write("}" * len(opened))
+        return None
 
-        :param indent: The level of indentation to apply.
-        :param prepend: Whether to prepend an empty line.
-        :param name: The name to use for the class (defaults to the class name).
-        :return: A list of strings representing the formatted class.
+    def to_environ(cls) -> Dict[str, str]:
         """
-        res = [""] if prepend else []
+        Export the environment variables that reproduce the class and its nested sections.
 
-        name = name or cls.__name__
-        res.append(" " * indent + f"class <{name}>:")
-        if len(cls) > 0:
-            for key, val in cls.items():
-                if _is_subclass(val, (_Config, _Section)):
-                    res += val.__format(indent=indent + 4, prepend=True)
+        Environment values (lazy, eager and filled by `__env_prefix__`) are exported under
+        their variable names (with prefixes applied) as the raw strings they are read from,
+        so any parser (including custom ones) reads them back into the same values. Values
+        are not resolved, eager values are taken from their recorded provenance. Variables
+        that are not set (i.e. the default is used), eager values whose raw strings are not
+        recorded (binary and DSN values, which may hold secrets) and values not bound
+        to an environment variable are skipped.
+
+        :return: A dictionary of variable names to raw string values.
+        """
+        environ: Dict[str, str] = {}
+        for owner, path, key, member in cls.__walk():
+            if _is_subclass(member, (_Config, _Section)):
+                continue
+
+            source = get_env_source(member)
+            if source is not None:
+                env, name, _ = source
+                if name in env._environ:
+                    environ[name] = env._environ[name]
+            elif key in _ENV_SOURCES.get(owner, {}):
+                name, raw = _ENV_SOURCES[owner][key]
+                environ[name] = raw
+            else:
+                layer = next(base for base in owner.__mro__ if key in base.__dict__)
+                index = PROVENANCE.find(layer, key)
+                if index is not None:
+                    _, name, recorded, _ = PROVENANCE.describe(index)
+                    if recorded is not None:
+                        environ[name] = recorded
+        return environ
+
+    def __fingerprint(cls) -> bytes:
+        """
+        Compute the content hash of the resolved values of the class and its nested sections.
+
+        Each section hash combines its own values with the hashes of its nested sections
+        and is cached until any lazy value is re-fetched. Sections with computed members
+        are not cached. The tree is walked iteratively (post-order) with an explicit stack.
+
+        :return: The content hash.
+        """
+        fetch_count = get_fetch_count()
+
+        def get_cached(section: Any) -> Optional[bytes]:
+            cached = _FINGERPRINTS.get(section)
+            if (cached is not None) and (cached[0] == fetch_count):
+                return cached[1]
+            return None
+
+        digest = get_cached(cls)
+        if digest is not None:
+            return digest
+
+        Frame = Tuple[Any, blake2b, Iterator[str], List[bool]]
+        stack: List[Frame] = [(cls, blake2b(digest_size=16), iter(cls.__members), [True])]
+        while True:
+            section, hasher, keys, cacheable = stack[-1]
+            key = next(keys, None)
+            if key is None:
+                stack.pop()
+                digest = hasher.digest()
+                if cacheable[0]:
+                    _FINGERPRINTS[section] = (fetch_count, digest)
+                if len(stack) == 0:
+                    return digest
+                stack[-1][1].update(digest)
+                stack[-1][3][0] = stack[-1][3][0] and cacheable[0]
+                continue
+
+            hasher.update(key.encode() + b"\0")
+            member = inspect.getattr_static(section, key)
+            if _is_subclass(member, (_Config, _Section)):
+                child = get_cached(member)
+                if child is None:
+                    stack.append((member, blake2b(digest_size=16), iter(member.__members), [True]))
                 else:
-                    res.append(" " * (indent + 4) + f"{key} = {val!r}")
-        else:
-            res.append(" " * (indent + 4) + "...")
+                    hasher.update(child)
+                continue
 
-        return res
+            if hasattr(type(member), "__get__"):
+                cacheable[0] = False
+            hasher.update(canonical_repr(getattr(section, key)).encode() + b"\0")
+
+    def fingerprint(cls) -> str:
+        """
+        Get the content hash of the resolved values of the class and its nested sections.
+
+        Classes with equal keys and values (including nested sections) have equal fingerprints.
+        The hash is cached until any lazy value is re-fetched.
+
+        :return: The hexadecimal content hash.
+        :raises EnvError: If a value cannot be resolved.
+        :raises TypeError: If a value can only be represented by its address (e.g. a function).
+        """
+        return cls.__fingerprint().hex()
+
+    def diff(cls, other: Any) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Compare the resolved values with another class.
+
+        Only the nested sections whose fingerprints differ are compared member by member,
+        the differences of a section are listed before the ones of its nested sections.
+
+        :param other: The class to compare with.
+        :return: A dictionary of dotted paths of the differing members to pairs of values
+                 (this value, the other value), `Nil` stands for a missing member.
+        :raises EnvError: If a value cannot be resolved.
+        :raises TypeError: If a value can only be represented by its address (e.g. a function).
+        """
+        changes: Dict[str, Tuple[Any, Any]] = {}
+        queue: List[Tuple[Any, Any, str]] = [(cls, other, "")]
+        for left, right, path in queue:
+            if left.__fingerprint() == right.__fingerprint():
+                continue
+
+            right_keys = right.__members
+            keys = list(left.__members) + [key for key in right_keys if key not in left]
+            for key in keys:
+                member_path = f"{path}.{key}" if path else key
+                left_val = getattr(left, key) if key in left else Nil
+                right_val = getattr(right, key) if key in right_keys else Nil
+                left_is_section = _is_subclass(left_val, (_Config, _Section))
+                right_is_section = _is_subclass(right_val, (_Config, _Section))
+                if left_is_section and right_is_section:
+                    queue.append((left_val, right_val, member_path))
+                elif left_is_section or right_is_section or \
+                        (canonical_repr(left_val) != canonical_repr(right_val)):
+                    changes[member_path] = (left_val, right_val)
+        return changes
+
+    def freeze(cls) -> FrozenSection:
+        """
+        Take a resolved, immutable snapshot of the class and its nested sections.
+
+        Snapshots with equal values are equal and hashable, so unlike the class itself
+        they can be used as value-based keys (e.g. for `functools.lru_cache`).
+        The hash is computed once per snapshot. Mutable values are deeply frozen (see
+        `parsers._freeze`), so the snapshot does not change along with them.
+
+        :return: The snapshot.
+        :raises EnvError: If a value cannot be resolved.
+        """
+        values: Dict[str, Dict[str, Any]] = {"": {}}
+        memo: Dict[Any, Any] = {}
+        snapshot = FrozenSection(cls.__get_full_name(), values[""])
+        for owner, path, key, member in cls.__walk():
+            if _is_subclass(member, (_Config, _Section)):
+                member_path = f"{path}.{key}" if path else key
+                values[member_path] = {}
+                values[path][key] = FrozenSection(member.__get_full_name(), values[member_path])
+            else:
+                values[path][key] = _freeze(getattr(owner, key), memo)
+        return snapshot
+
+    def __select(cls, *,
+                 include: Optional[Tuple[str, ...]] = None,
+                 exclude: Tuple[str, ...] = (),
+                 roles: Optional[FrozenSet[str]] = None) -> List[Tuple[Any, str]]:
+        """
+        Select the members to prefetch without resolving them.
+
+        :param include: Path patterns of members to prefetch (None selects all members).
+        :param exclude: Path patterns of members to skip.
+        :param roles: Role tags of sections to prefetch (None selects all sections).
+        :return: A list of (owner class, key) pairs in declaration order.
+        """
+        def enter(path: str, section: Any) -> bool:
+            if _match_path(path, exclude):
+                return False
+            tags = inspect.getattr_static(section, "__roles__", None)
+            return (roles is None) or (tags is None) or not roles.isdisjoint(_as_tuple(tags))
+
+        selected_sections = set()
+        selection: List[Tuple[Any, str]] = []
+        for owner, path, key, member in cls.__walk(enter=enter):
+            member_path = f"{path}.{key}" if path else key
+            selected = ((include is None) or (path in selected_sections) or
+                        _match_path(member_path, include))
+            if _is_subclass(member, (_Config, _Section)):
+                if selected and (include is not None):
+                    selected_sections.add(member_path)
+            elif selected and not _match_path(member_path, exclude):
+                selection.append((owner, key))
+        return selection
+
+    def prefetch(cls, *, include: Optional[Iterable[str]] = None,
+                 exclude: Optional[Iterable[str]] = None,
+                 roles: Optional[Iterable[str]] = None,
+                 timeout: Optional[float] = None,
+                 fail_fast: bool = False,
+                 max_errors: Optional[int] = None) -> None:
+        """
+        Prefetch all (or the selected) members and raise an error if any issues occur.
+
+        Members are selected by dotted paths relative to the class (e.g. "Db.HOST") matched
+        against glob patterns (e.g. "Db.*"). A pattern matching a section selects the whole
+        section. Sections tagged with `__roles__` (a tag or a tuple of tags) are prefetched
+        only for matching roles, untagged sections are shared by all roles.
+
+        Once the timeout expires, the first error occurs (with `fail_fast`) or `max_errors`
+        errors are collected, no more members are fetched. The error then lists
+        the members that were not attempted along with the failed ones.
+
+        :param include: Path patterns (or a single pattern) of members to prefetch
+                        (default is all members).
+        :param exclude: Path patterns (or a single pattern) of members to skip (default is none).
+        :param roles: Role tags (or a single tag) of sections to prefetch
+                      (default is all sections).
+        :param timeout: The time budget in seconds (default is no limit).
+        :param fail_fast: Whether to stop at the first error (default is False).
+        :param max_errors: The number of errors to stop at (default is no limit).
+        :raises ConfigEnvError: If there are errors during prefetching or
+                                if some members were not attempted.
+        """
+        assert (max_errors is None) or (max_errors > 0)
+        if fail_fast:
+            max_errors = 1
+        deadline = None if timeout is None else (time.monotonic() + timeout)
+
+        selection = cls.__select(include=None if include is None else _as_tuple(include),
+                                 exclude=() if exclude is None else _as_tuple(exclude),
+                                 roles=None if roles is None else frozenset(_as_tuple(roles)))
+
+        errors: List[str] = []
+        reason = None
+        for index, (owner, key) in enumerate(selection):
+            if (max_errors is not None) and (len(errors) >= max_errors):
+                reason = f"stopped after {len(errors)} error(s)"
+            elif (deadline is not None) and (time.monotonic() >= deadline):
+                reason = f"timed out after {timeout}s"
+            if reason is not None:
+                selection = selection[index:]
+                break
+            try:
+                getattr(owner, key)
+            except (EnvKeyError, EnvParseError) as e:
+                errors.append(f"{owner.__get_full_name()}.{key}: {e}")
+
+        prefix = os.linesep + "- "
+        messages = []
+        if len(errors) > 0:
+            messages.append(f"Failed to prefetch:{prefix}" + prefix.join(errors))
+        if reason is not None:
+            skipped = [f"{owner.__get_full_name()}.{key}" for owner, key in selection]
+            messages.append(f"Not attempted ({reason}):{prefix}" + prefix.join(skipped))
+        if len(messages) > 0:
+            raise ConfigEnvError(os.linesep.join(messages))
+
+    def __format(cls, *, name: Optional[str] = None,
+                 max_depth: Optional[int] = None,
+                 max_value_len: Optional[int] = None,
+                 redact: Tuple[str, ...] = ()) -> Iterator[str]:
+        """
+        Format the class into a readable string representation, line by line.
+
+        Values are resolved one at a time, while the lines are produced.
+
+        :param name: The name to use for the class (defaults to the class name).
+        :param max_depth: The number of nested section levels to expand (default is all).
+        :param max_value_len: The maximum length of a value representation (default is no limit).
+        :param redact: Path patterns of members whose values are hidden.
+        :return: An iterator of formatted lines.
+        """
+        def enter(path: str, section: Any) -> bool:
+            return (max_depth is None) or (path.count(".") < max_depth)
+
+        yield f"class <{name or cls.__name__}>:"
+        if len(cls) == 0:
+            yield " " * 4 + "..."
+
+        for owner, path, key, member in cls.__walk(enter=enter):
+            indent = " " * 4 * (path.count(".") + 2 if path else 1)
+            if _is_subclass(member, (_Config, _Section)):
+                member_path = f"{path}.{key}" if path else key
+                yield ""
+                yield indent + f"class <{member.__name__}>:"
+                if (len(member) == 0) or not enter(member_path, member):
+                    yield indent + " " * 4 + "..."
+                continue
+
+            if _match_path(f"{path}.{key}" if path else key, redact):
+                yield indent + f"{key} = ***"
+                continue
+            try:
+                val = getattr(owner, key)
+            except Exception as e:
+                val = e
+            text = repr(val)
+            if (max_value_len is not None) and (len(text) > max_value_len):
+                text = text[:max_value_len] + "..."
+            yield indent + f"{key} = {text}"
+
+    def dump(cls, stream: Any = sys.stdout, *,
+             max_depth: Optional[int] = None,
+             max_value_len: Optional[int] = None,
+             redact: Optional[Iterable[str]] = None) -> None:
+        """
+        Write the class structure to the specified stream, line by line.
+
+        Unlike `repr()`, the representation is never built as a whole, so that
+        large configs can be logged without holding all lines in memory.
+
+        :param stream: The stream to write to (default is sys.stdout).
+        :param max_depth: The number of nested section levels to expand (default is all).
+        :param max_value_len: The maximum length of a value representation (default is no limit).
+        :param redact: Path patterns of members whose values are hidden, e.g. "*.PASSWORD"
+                       (default is none).
+        """
+        lines = cls.__format(name=cls.__get_full_name(), max_depth=max_depth,
+                             max_value_len=max_value_len,
+                             redact=() if redact is None else tuple(redact))
+        for line in lines:
+            print(line, file=stream)
 
     def print(cls, stream: Any = sys.stdout) -> None:
         """
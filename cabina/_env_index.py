@@ -0,0 +1,66 @@
+from bisect import bisect_left
+from typing import Dict, List, Mapping, Tuple
+
+__all__ = ("EnvIndex",)
+
+
+class EnvIndex:
+    """
+    Represents a prefix index over the variable names of an environment snapshot.
+
+    The names are sorted once, so that every prefix query is a binary search
+    instead of a scan over the whole environment. Query results are memoized.
+    """
+
+    def __init__(self, environ: Mapping[str, str]) -> None:
+        """
+        Initialize the EnvIndex by sorting the variable names of the environment.
+
+        :param environ: A mapping of environment variables.
+        """
+        self._keys: List[str] = sorted(environ.keys())
+        self._cache: Dict[str, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed variable names.
+
+        :return: The number of variable names.
+        """
+        return len(self._keys)
+
+    def is_stale(self, environ: Mapping[str, str]) -> bool:
+        """
+        Check whether the environment has changed its number of names since indexing.
+
+        Only the number of variables is compared, so the check is O(1) on every lookup.
+        A variable replaced by another one (the number stays the same) is not detected,
+        the owner of the index has to drop it explicitly (see `Environment.refresh`).
+
+        :param environ: A mapping of environment variables.
+        :return: True if the index must be rebuilt, False otherwise.
+        """
+        return len(environ) != len(self._keys)
+
+    def find(self, prefix: str) -> Tuple[str, ...]:
+        """
+        Find all variable names that start with the given prefix.
+
+        :param prefix: The prefix to search for.
+        :return: A sorted tuple of matching variable names.
+        """
+        try:
+            return self._cache[prefix]
+        except KeyError:
+            pass
+
+        if prefix == "":
+            found = tuple(self._keys)
+        else:
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            lo = bisect_left(self._keys, prefix)
+            hi = bisect_left(self._keys, upper, lo)
+            found = tuple(self._keys[lo:hi])
+
+        self._cache[prefix] = found
+        return found
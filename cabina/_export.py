@@ -0,0 +1,113 @@
+import json
+import re
+from array import array
+from base64 import b64encode
+from datetime import timedelta
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ._future_value import FutureValue
+from ._lazy_environment import LazyEnvironment
+from .parsers import Dsn, _SplitIterable
+
+__all__ = ("canonical_repr", "get_env_source", "json_dumps",)
+
+_ADDRESS_PATTERN = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _json_value(value: Any) -> Any:
+    """
+    Convert a value into JSON types.
+
+    This is the only place that decides how values are encoded: tuples, sets and arrays
+    become lists, mappings become objects, bytes are base64 encoded, enums are encoded
+    by value and time intervals in seconds. A DSN becomes an object with the password
+    masked, like in its representation. Any other value (or mapping key) that is not
+    a JSON type is encoded as its string form.
+
+    The conversion is done before encoding, since the json module encodes tuples
+    (including named tuples such as `Dsn`) natively, without calling `default`.
+
+    :param value: The value to convert.
+    :return: A value of JSON types (dict, list, str, int, float, bool or None).
+    """
+    if (value is None) or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, Dsn):
+        fields = value._asdict()
+        if value.password is not None:
+            fields["password"] = "***"
+        return _json_value(fields)
+    if isinstance(value, Mapping):
+        return {(key if (key is None) or isinstance(key, (str, int, float)) else str(key)):
+                _json_value(val) for key, val in value.items()}
+    if isinstance(value, (tuple, list, set, frozenset, array, _SplitIterable)):
+        return [_json_value(item) for item in value]
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return b64encode(value).decode()
+    if isinstance(value, Enum):
+        return _json_value(value.value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return str(value)
+
+
+def json_dumps(value: Any) -> str:
+    """
+    Encode a value as compact JSON with the standard json module (see `_json_value`).
+
+    :param value: The value to encode.
+    :return: The JSON string.
+    """
+    return json.dumps(_json_value(value), separators=(",", ":"), ensure_ascii=False)
+
+
+def canonical_repr(value: Any) -> str:
+    """
+    Get a representation of a value that is equal for equal values.
+
+    Unlike `repr()`, the elements of sets and mappings are sorted, binary values (`bytes`,
+    `memoryview`, `array`) are encoded by their contents, lazy iterables are represented
+    by their elements, and the type of every value is included.
+
+    :param value: The value to represent.
+    :return: The canonical representation.
+    :raises TypeError: If the representation of the value depends on its address in memory.
+    """
+    name = type(value).__qualname__
+    if isinstance(value, (set, frozenset)):
+        return f"{name}{{" + ",".join(sorted(canonical_repr(item) for item in value)) + "}"
+    if isinstance(value, Mapping):
+        items = sorted(f"{canonical_repr(key)}:{canonical_repr(val)}" for key, val in value.items())
+        return f"{name}{{" + ",".join(items) + "}"
+    if isinstance(value, (tuple, list, _SplitIterable)):
+        return f"{name}(" + ",".join(canonical_repr(item) for item in value) + ")"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"{name}:{bytes(value).hex()}"
+    if isinstance(value, array):
+        return f"{name}:{value.typecode}:{value.tobytes().hex()}"
+
+    text = repr(value)
+    if _ADDRESS_PATTERN.search(text):
+        raise TypeError(f"Failed to represent {text} by value: its repr depends on the address")
+    return f"{name}:{text}"
+
+
+def get_env_source(value: Any) -> Optional[Tuple[LazyEnvironment, str, Dict[str, Any]]]:
+    """
+    Get the environment variable a lazy value is bound to.
+
+    :param value: The (unresolved) member value.
+    :return: The environment, the full variable name (with prefix) and the keyword arguments
+             of the accessor (parser, encoding, etc.), or None if the value is not
+             bound to an environment variable.
+    """
+    if not isinstance(value, FutureValue):
+        return None
+    accessor = value._accessor
+    env = getattr(accessor, "__self__", None)
+    if not isinstance(env, LazyEnvironment) or len(value._args) == 0:
+        return None
+    if getattr(accessor, "__name__", None) not in ("get", "_get_bytes"):
+        return None
+    return env, env._prefix + value._args[0], value._kwargs
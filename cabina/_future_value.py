@@ -1,8 +1,13 @@
-from typing import Any, Callable, Generic, TypeVar, Union
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar, Union
 
 from niltype import Nil, NilType
 
+__all__ = ("FutureValue", "ValueType", "combine",)
+
 ValueType = TypeVar("ValueType")
+ResultType = TypeVar("ResultType")
+
+_fetch_count = 0
 
 
 class FutureValue(Generic[ValueType]):
@@ -11,6 +16,8 @@ class FutureValue(Generic[ValueType]):
 
     This class allows the deferred computation of a value using a provided accessor function.
     The value is cached after the first computation and reused for subsequent accesses.
+    A value derived from other FutureValues (see `map` and `combine`) is computed again
+    on the next access after any of them is fetched again.
     """
 
     def __init__(self, accessor: Callable[..., ValueType], *args: Any, **kwargs: Any) -> None:
@@ -24,32 +31,95 @@ class FutureValue(Generic[ValueType]):
         self._accessor = accessor
         self._args = args
         self._kwargs = kwargs
+        self._converter: Optional[Callable[[Any], ValueType]] = None
         self._value: Union[ValueType, NilType] = Nil
+        self._fetches = 0
+        self._seen: Optional[Tuple[int, ...]] = None
 
     def fetch(self) -> ValueType:
         """
         Compute the value by calling the accessor function.
 
         This method directly evaluates the value and updates the internal cache.
+        The converter (if set, see `convert`) is applied to the result on every call.
 
         :return: The computed value.
         """
-        self._value = self._accessor(*self._args, **self._kwargs)
+        global _fetch_count
+        if self._value is not Nil:
+            _fetch_count += 1
+        value = self._accessor(*self._args, **self._kwargs)
+        if self._converter is not None:
+            value = self._converter(value)
+        self._value = value
+        self._fetches += 1
+        if self._accessor is _apply:
+            self._seen = tuple(source._fetches for source in self._sources())
         return self._value
 
     def get(self) -> ValueType:
         """
         Retrieve the value, computing it if necessary.
 
-        If the value has already been computed, the cached value is returned.
-        Otherwise, the accessor function is called to compute and cache the value.
+        If the value has already been computed (and none of the values it is derived from
+        was fetched again since), the cached value is returned. Otherwise, the accessor
+        function is called to compute and cache the value.
 
         :return: The computed or cached value.
         """
-        if self._value is Nil:
+        if (self._value is Nil) or ((self._seen is not None) and self._is_outdated()):
             return self.fetch()
         return self._value
 
+    def _sources(self) -> List["FutureValue[Any]"]:
+        """
+        Get the FutureValues this value is derived from (see `map` and `combine`).
+
+        :return: A list of FutureValues (empty for a value that is not derived).
+        """
+        if self._accessor is not _apply:
+            return []
+        return [arg for arg in self._args[1:] if isinstance(arg, FutureValue)]
+
+    def _is_outdated(self) -> bool:
+        """
+        Check whether any of the values this value is derived from was fetched again
+        (directly or through its own sources) since this value was computed.
+
+        :return: True if the value must be computed again, False otherwise.
+        """
+        sources = self._sources()
+        if tuple(source._fetches for source in sources) != self._seen:
+            return True
+        return any(source._seen is not None and source._is_outdated() for source in sources)
+
+    def convert(self, fn: Callable[[Any], ValueType]) -> None:
+        """
+        Set a function to apply to the result of the accessor (e.g. a parser inferred
+        from an annotation).
+
+        Unlike `map`, the FutureValue is changed in place: it keeps its accessor, so
+        `fetch()` still reads the source again, and its representation stays the same.
+        Any computed value is dropped.
+
+        :param fn: The function to apply to the result of the accessor.
+        """
+        self._converter = fn
+        self._value = Nil
+
+    def map(self, fn: Callable[[ValueType], ResultType]) -> "FutureValue[ResultType]":
+        """
+        Create a new FutureValue derived from this one.
+
+        The function is applied to the value of this FutureValue on first access,
+        the result is cached like any other FutureValue and computed again after
+        this FutureValue is fetched again.
+
+        :param fn: The function to apply to the value.
+        :return: A new FutureValue holding the result of the function.
+        """
+        return FutureValue(_apply, fn, self)
+
     def __repr__(self) -> str:
         """
         Get a string representation of the FutureValue instance.
@@ -69,3 +139,55 @@ class FutureValue(Generic[ValueType]):
         elif len(args) > 0:
             return f"FutureValue({str_args})"
         return f"FutureValue({str_kwargs})"
+
+
+def get_fetch_count() -> int:
+    """
+    Get the number of FutureValue re-fetches made so far.
+
+    The counter changes whenever an already computed FutureValue is computed again,
+    so it can be used to invalidate anything derived from resolved values.
+
+    :return: The number of re-fetches.
+    """
+    return _fetch_count
+
+
+def _resolve(value: Any) -> Any:
+    """
+    Resolve a FutureValue, any other value is returned as is.
+
+    :param value: The value to resolve.
+    :return: The resolved value.
+    """
+    if isinstance(value, FutureValue):
+        return value.get()
+    return value
+
+
+def _apply(fn: Callable[..., ResultType], *values: Any) -> ResultType:
+    """
+    Apply a function to the resolved values.
+
+    :param fn: The function to apply.
+    :param values: The values (or FutureValues) to pass to the function.
+    :return: The result of the function.
+    """
+    return fn(*[_resolve(value) for value in values])
+
+
+def combine(first: Any, second: Any,
+            fn: Callable[[Any, Any], ResultType]) -> FutureValue[ResultType]:
+    """
+    Create a new FutureValue derived from two values.
+
+    Either value can be a FutureValue or a plain value. The function is applied
+    on first access, the result is cached like any other FutureValue and computed again
+    after either FutureValue is fetched again.
+
+    :param first: The first value (or FutureValue).
+    :param second: The second value (or FutureValue).
+    :param fn: The function to apply to both values.
+    :return: A new FutureValue holding the result of the function.
+    """
+    return FutureValue(_apply, fn, first, second)
@@ -1,16 +1,28 @@
+import json
 import os
+from array import array
 from functools import partial
-from typing import Any, Callable, Dict, Mapping, Tuple, Union, cast
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, Union, cast
 
 from niltype import Nil, NilType
 
+from ._batch import EnvBatch
+from ._env_index import EnvIndex
 from ._future_value import FutureValue, ValueType
-from .errors import EnvKeyError
+from ._provenance import DEFAULT, DEFAULT_FACTORY, ENVIRONMENT, PROVENANCE, is_secret_parser
+from .errors import EnvKeyError, EnvParseError
 from .parsers import (
+    parse_array,
     parse_as_is,
     parse_bool,
+    parse_bytes,
+    parse_file,
     parse_float,
+    parse_frozenset,
     parse_int,
+    parse_iter,
+    parse_json,
     parse_none,
     parse_str,
     parse_tuple,
@@ -35,6 +47,7 @@ class LazyEnvironment:
         """
         self._environ = environ
         self._prefix = prefix
+        self._index: Optional[EnvIndex] = None
 
     def __repr__(self) -> str:
         """
@@ -45,29 +58,42 @@ class LazyEnvironment:
         return f"cabina.LazyEnvironment({self._environ!r})"
 
     def get(self, name: str, default: Union[NilType, ValueType] = Nil,
-            parser: Callable[[str], ValueType] = parse_as_is) -> ValueType:
+            parser: Callable[[str], ValueType] = parse_as_is, *,
+            default_factory: Union[NilType, Callable[[], ValueType]] = Nil) -> ValueType:
         """
         Retrieve an environment variable, applying a parser and handling defaults.
 
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
         :param parser: A callable to parse the variable's value (default is `parse_as_is`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :return: The parsed value of the environment variable or the default value.
         :raises EnvKeyError: If the variable is not found and no default value is provided.
         """
         if self._prefix:
             name = self._prefix + name
+        assert default is Nil or default_factory is Nil
         try:
             value = self._environ[name]
         except KeyError:
-            if default is Nil:
-                raise EnvKeyError(f"{name!r} does not exist") from None
-            return default
+            if default is not Nil:
+                PROVENANCE.record_lazy(self, name, None, DEFAULT)
+                return default
+            if default_factory is not Nil:
+                result = default_factory()
+                PROVENANCE.record_lazy(self, name, None, DEFAULT_FACTORY)
+                return result
+            raise EnvKeyError(f"{name!r} does not exist") from None
         else:
-            return parser(value)
+            result = parser(value)
+            PROVENANCE.record_lazy(self, name, None if is_secret_parser(parser) else value,
+                                   ENVIRONMENT)
+            return result
 
     def raw(self, name: str, default: Union[NilType, ValueType] = Nil,
-            parser: Callable[[str], ValueType] = parse_as_is) -> ValueType:
+            parser: Callable[[str], ValueType] = parse_as_is, *,
+            default_factory: Union[NilType, Callable[[], ValueType]] = Nil) -> ValueType:
         """
         Retrieve an environment variable lazily, returning a `FutureValue`.
 
@@ -76,17 +102,23 @@ class LazyEnvironment:
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
         :param parser: A callable to parse the variable's value (default is `parse_as_is`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :return: A `FutureValue` instance for deferred evaluation of the environment variable.
         """
+        assert default is Nil or default_factory is Nil
         kwargs: Dict[str, Any] = {}
         if default is not Nil:
             kwargs["default"] = default
+        if default_factory is not Nil:
+            kwargs["default_factory"] = default_factory
         if parser is not parse_as_is:
             kwargs["parser"] = parser
         return cast(ValueType, FutureValue[ValueType](self.get, name, **kwargs))
 
     def __call__(self, name: str, default: Union[NilType, ValueType] = Nil,
-                 parser: Callable[[str], ValueType] = parse_as_is) -> ValueType:
+                 parser: Callable[[str], ValueType] = parse_as_is, *,
+                 default_factory: Union[NilType, Callable[[], ValueType]] = Nil) -> ValueType:
         """
         Retrieve an environment variable lazily by calling the instance as a function.
 
@@ -95,56 +127,253 @@ class LazyEnvironment:
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
         :param parser: A callable to parse the variable's value (default is `parse_as_is`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :return: A `FutureValue` instance for deferred evaluation of the environment variable.
         """
-        return self.raw(name, default, parser)
+        return self.raw(name, default, parser, default_factory=default_factory)
 
-    def none(self, name: str, default: Union[NilType, None] = Nil) -> None:
+    def many(self, parsers: Mapping[str, Any], *,
+             defaults: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Retrieve a group of environment variables lazily, resolving them in a single pass.
+
+        The whole group is looked up and parsed on the first access to any of its values,
+        `fetch()` on a value that was already resolved looks the whole group up again.
+        Errors are raised per variable, so `prefetch()` reports every failed key.
+
+        :param parsers: A mapping of variable names (with prefix applied, if set) to parsers.
+        :param defaults: An optional mapping of variable names to default values.
+        :return: A dictionary of variable names to `FutureValue` instances.
+        """
+        batch = EnvBatch(self._environ, parsers, prefix=self._prefix, defaults=defaults)
+        return {key: FutureValue[Any](batch.get, key) for key in parsers}
+
+    def _namespace(self, prefix: str, *, strip: bool,
+                   parser: Callable[[str], ValueType]) -> Mapping[str, ValueType]:
+        """
+        Collect all environment variables that start with the given prefix.
+
+        The variable names are served from a prefix index, rebuilt when the number of
+        variables changes (or after `refresh()`).
+
+        :param prefix: The prefix of the variable names (with prefix applied, if set).
+        :param strip: Whether to strip the prefix from the resulting keys.
+        :param parser: A callable to parse each variable's value.
+        :return: A read-only mapping of variable names to parsed values.
+        :raises EnvParseError: If any variable cannot be parsed.
+        """
+        if (self._index is None) or self._index.is_stale(self._environ):
+            self._index = EnvIndex(self._environ)
+
+        prefix = self._prefix + prefix
+        offset = len(prefix) if strip else 0
+
+        result = {}
+        for name in self._index.find(prefix):
+            try:
+                value = self._environ[name]
+            except KeyError:
+                continue
+            try:
+                result[name[offset:]] = parser(value)
+            except EnvParseError as e:
+                raise EnvParseError(f"Failed to parse {name!r}: {e}") from None
+        return MappingProxyType(result)
+
+    def namespace(self, prefix: str, *, strip: bool = False,
+                  parser: Callable[[str], ValueType] = parse_as_is) -> Mapping[str, ValueType]:
+        """
+        Retrieve all environment variables that start with the given prefix lazily.
+
+        :param prefix: The prefix of the variable names (with prefix applied, if set).
+        :param strip: Whether to strip the prefix from the resulting keys (default is False).
+        :param parser: A callable to parse each variable's value (default is `parse_as_is`).
+        :return: A `FutureValue` instance for deferred evaluation of the read-only mapping.
+        """
+        future = FutureValue[Mapping[str, ValueType]](self._namespace, prefix,
+                                                      strip=strip, parser=parser)
+        return cast(Mapping[str, ValueType], future)
+
+    def refresh(self) -> None:
+        """
+        Drop the prefix index of variable names, so that the next `namespace()` call
+        re-reads them.
+
+        Added and removed variables are picked up automatically, call this after replacing
+        variables in a way that keeps their number the same.
+        """
+        self._index = None
+
+    def _get_bytes(self, name: str, default: Union[NilType, bytes, memoryview] = Nil, *,
+                   default_factory: Union[NilType, Callable[[], Union[bytes, memoryview]]] = Nil,
+                   encoding: str, view: bool) -> Union[bytes, memoryview]:
+        """
+        Retrieve an environment variable as binary data.
+
+        Raw values of `os.environ` are read from `os.environb` (where supported),
+        so that no str/bytes round-trip is involved.
+
+        :param name: The name of the environment variable (with prefix applied, if set).
+        :param default: The default value to return if the variable is not found.
+        :param default_factory: A callable producing the default value if the variable is not found.
+        :param encoding: The encoding of the binary data ("base64", "hex" or "raw").
+        :param view: Whether to wrap the result into a `memoryview`.
+        :return: The decoded binary value of the environment variable or the default value.
+        :raises EnvKeyError: If the variable is not found and no default value is provided.
+        """
+        name = self._prefix + name
+        environ: Mapping[Any, Any] = self._environ
+        key: Any = name
+        if encoding == "raw" and self._environ is os.environ and os.supports_bytes_environ:
+            environ, key = os.environb, os.fsencode(name)
+        try:
+            value = environ[key]
+        except KeyError:
+            if default is not Nil:
+                PROVENANCE.record_lazy(self, name, None, DEFAULT)
+                return default
+            if default_factory is not Nil:
+                result = default_factory()
+                PROVENANCE.record_lazy(self, name, None, DEFAULT_FACTORY)
+                return result
+            raise EnvKeyError(f"{name!r} does not exist") from None
+        if isinstance(value, str):
+            value = parse_bytes(value, encoding=encoding)
+        result = memoryview(value) if view else cast(bytes, value)
+        PROVENANCE.record_lazy(self, name, None, ENVIRONMENT)  # may hold a secret key
+        return result
+
+    def bytes(self, name: str,
+              default: Union[NilType, bytes, memoryview] = Nil, *,
+              default_factory: Union[NilType, Callable[[], Union[bytes, memoryview]]] = Nil,
+              encoding: str = "base64",
+              view: bool = False) -> Union[bytes, memoryview]:
+        """
+        Retrieve an environment variable as binary data lazily.
+
+        The value is looked up and decoded (with a single pass) only on first access.
+
+        :param name: The name of the environment variable (with prefix applied, if set).
+        :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
+        :param encoding: The encoding of the binary data: "base64" (default), "hex" or "raw".
+        :param view: Whether to return a zero-copy `memoryview` over the bytes (default is False).
+        :return: A `FutureValue` instance for deferred evaluation of the binary value.
+        """
+        assert default is Nil or isinstance(default, (bytes, memoryview))
+        kwargs: Dict[str, Any] = {"encoding": encoding, "view": view}
+        if default is not Nil:
+            kwargs["default"] = default
+        if default_factory is not Nil:
+            kwargs["default_factory"] = default_factory
+        future = FutureValue[Union[bytes, memoryview]](self._get_bytes, name, **kwargs)
+        return cast(Union[bytes, memoryview], future)
+
+    def file(self, name: str, default: Union[NilType, ValueType] = Nil, *,
+             default_factory: Union[NilType, Callable[[], ValueType]] = Nil,
+             mode: str = "text",
+             parser: Callable[[Any], ValueType] = parse_as_is,
+             max_size: Optional[int] = None,
+             encoding: str = "utf-8") -> ValueType:
+        """
+        Retrieve an environment variable as a path to a file and parse the file lazily.
+
+        The file is opened and parsed only on first access.
+
+        :param name: The name of the environment variable (with prefix applied, if set).
+        :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
+        :param mode: The way the file is read: "text" (default), "bytes" or "mmap" (the parser
+                     receives a zero-copy `memoryview` of the memory-mapped file).
+        :param parser: A callable to parse the file contents (default is `parse_as_is`).
+        :param max_size: The maximum allowed file size in bytes (default is no limit).
+        :param encoding: The encoding of the file in the "text" mode (default is "utf-8").
+        :return: A `FutureValue` instance for deferred evaluation of the file contents.
+        """
+        file_parser = partial(parse_file, mode=mode, parser=parser,
+                              max_size=max_size, encoding=encoding)
+        return self(name, default, file_parser, default_factory=default_factory)
+
+    def json(self, name: str, default: Union[NilType, Any] = Nil, *,
+             default_factory: Union[NilType, Callable[[], Any]] = Nil,
+             freeze: bool = False, loads: Callable[[str], Any] = json.loads) -> Any:
+        """
+        Retrieve an environment variable as a decoded JSON value lazily.
+
+        :param name: The name of the environment variable (with prefix applied, if set).
+        :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
+        :param freeze: Whether to deeply freeze the result into `MappingProxyType`/tuples
+                       (default is False).
+        :param loads: The JSON decoder to use (default is `json.loads`).
+        :return: The parsed JSON value of the environment variable or the default value.
+        """
+        parser = partial(parse_json, freeze=freeze, loads=loads)
+        return self(name, default, parser, default_factory=default_factory)
+
+    def none(self, name: str, default: Union[NilType, None] = Nil, *,
+             default_factory: Union[NilType, Callable[[], None]] = Nil) -> None:
         """
         Retrieve an environment variable as a `None` type value lazily.
 
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :return: The parsed `None` value of the environment variable or the default value.
         """
         assert isinstance(default, (type(None), NilType))
-        return self(name, default, parse_none)
+        return self(name, default, parse_none, default_factory=default_factory)
 
-    def bool(self, name: str, default: Union[NilType, bool] = Nil) -> bool:
+    def bool(self, name: str, default: Union[NilType, bool] = Nil, *,
+             default_factory: Union[NilType, Callable[[], bool]] = Nil) -> bool:
         """
         Retrieve an environment variable as a boolean value lazily.
 
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :return: The parsed boolean value of the environment variable or the default value.
         """
         assert default is Nil or isinstance(default, bool)
-        return self(name, default, parse_bool)
+        return self(name, default, parse_bool, default_factory=default_factory)
 
-    def int(self, name: str, default: Union[NilType, int] = Nil) -> int:
+    def int(self, name: str, default: Union[NilType, int] = Nil, *,
+            default_factory: Union[NilType, Callable[[], int]] = Nil) -> int:
         """
         Retrieve an environment variable as an integer value lazily.
 
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :return: The parsed integer value of the environment variable or the default value.
         """
         assert default is Nil or isinstance(default, int)
-        return self(name, default, parse_int)
+        return self(name, default, parse_int, default_factory=default_factory)
 
-    def float(self, name: str, default: Union[NilType, float] = Nil) -> float:
+    def float(self, name: str, default: Union[NilType, float] = Nil, *,
+              default_factory: Union[NilType, Callable[[], float]] = Nil) -> float:
         """
         Retrieve an environment variable as a floating-point value lazily.
 
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :return: The parsed float value of the environment variable or the default value.
         """
         assert default is Nil or isinstance(default, float)
-        return self(name, default, parse_float)
+        return self(name, default, parse_float, default_factory=default_factory)
 
     def tuple(self, name: str,
               default: Union[NilType, Tuple[ValueType, ...]] = Nil, *,
+              default_factory: Union[NilType, Callable[[], Tuple[ValueType, ...]]] = Nil,
               separator: str = ",",
               subparser: Callable[[str], Any] = parse_str) -> Tuple[ValueType, ...]:
         """
@@ -152,21 +381,88 @@ class LazyEnvironment:
 
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :param separator: The separator used to split the variable's value into elements.
         :param subparser: A callable to parse each element in the tuple (default is `parse_str`).
         :return: The parsed tuple value of the environment variable or the default value.
         """
         assert default is Nil or isinstance(default, tuple)
         parser = partial(parse_tuple, separator=separator, subparser=subparser)
-        return self(name, default, parser)
+        return self(name, default, parser, default_factory=default_factory)
+
+    def iter(self, name: str,
+             default: Union[NilType, Iterable[ValueType]] = Nil, *,
+             default_factory: Union[NilType, Callable[[], Iterable[ValueType]]] = Nil,
+             separator: str = ",",
+             subparser: Callable[[str], Any] = parse_str) -> Iterable[ValueType]:
+        """
+        Retrieve an environment variable as an iterable of parsed values lazily.
+
+        The elements are scanned and parsed only while iterating, which suits very large values.
+
+        :param name: The name of the environment variable (with prefix applied, if set).
+        :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
+        :param separator: The separator used to split the variable's value into elements.
+        :param subparser: A callable to parse each element (default is `parse_str`).
+        :return: The re-iterable parsed value of the environment variable or the default value.
+        """
+        assert default is Nil or hasattr(default, "__iter__")
+        parser = partial(parse_iter, separator=separator, subparser=subparser)
+        return self(name, default, parser, default_factory=default_factory)
+
+    def frozenset(self, name: str,
+                  default: Union[NilType, FrozenSet[ValueType]] = Nil, *,
+                  default_factory: Union[NilType, Callable[[], FrozenSet[ValueType]]] = Nil,
+                  separator: str = ",",
+                  subparser: Callable[[str], Any] = parse_str) -> FrozenSet[ValueType]:
+        """
+        Retrieve an environment variable as a frozenset of parsed values lazily.
+
+        :param name: The name of the environment variable (with prefix applied, if set).
+        :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
+        :param separator: The separator used to split the variable's value into elements.
+        :param subparser: A callable to parse each element (default is `parse_str`).
+        :return: The parsed frozenset value of the environment variable or the default value.
+        """
+        assert default is Nil or isinstance(default, frozenset)
+        parser = partial(parse_frozenset, separator=separator, subparser=subparser)
+        return self(name, default, parser, default_factory=default_factory)
+
+    def array(self, name: str,
+              default: Union[NilType, "array[Any]"] = Nil, *,
+              default_factory: Union[NilType, Callable[[], "array[Any]"]] = Nil,
+              typecode: str = "d",
+              separator: str = ",") -> "array[Any]":
+        """
+        Retrieve an environment variable as a compact typed array of numbers lazily.
+
+        :param name: The name of the environment variable (with prefix applied, if set).
+        :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
+        :param typecode: The `array` typecode of the elements (default is "d", i.e. double).
+        :param separator: The separator used to split the variable's value into elements.
+        :return: The parsed array value of the environment variable or the default value.
+        """
+        assert default is Nil or isinstance(default, array)
+        parser = partial(parse_array, typecode=typecode, separator=separator)
+        return self(name, default, parser, default_factory=default_factory)
 
-    def str(self, name: str, default: Union[NilType, str] = Nil) -> str:
+    def str(self, name: str, default: Union[NilType, str] = Nil, *,
+            default_factory: Union[NilType, Callable[[], str]] = Nil) -> str:
         """
         Retrieve an environment variable as a string value lazily.
 
         :param name: The name of the environment variable (with prefix applied, if set).
         :param default: The default value to return if the variable is not found (default is `Nil`).
+        :param default_factory: A callable producing the default value if the variable
+                                is not found (default is `Nil`).
         :return: A `FutureValue` instance for deferred evaluation of the string value.
         """
         assert default is Nil or isinstance(default, str)
-        return self.raw(name, default, parse_str)
+        return self.raw(name, default, parse_str, default_factory=default_factory)
@@ -0,0 +1,262 @@
+import time
+from array import array
+from functools import partial
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from weakref import WeakKeyDictionary, finalize
+
+from .parsers import parse_bytes, parse_dsn
+
+__all__ = ("Provenance", "ProvenanceTable", "PROVENANCE", "is_secret_parser",
+           "ENVIRONMENT", "DEFAULT", "DEFAULT_FACTORY",)
+
+ENVIRONMENT = 0
+DEFAULT = 1
+DEFAULT_FACTORY = 2
+
+_SOURCE_NAMES = ("environment", "default", "default_factory")
+
+_SECRET_PARSERS = (parse_bytes, parse_dsn)
+
+
+def is_secret_parser(parser: Any) -> bool:
+    """
+    Check whether a parser reads values that may hold secrets (binary keys, DSN passwords).
+
+    Raw values read with such parsers are not recorded, the same way the parsers keep them
+    out of error messages.
+
+    :param parser: The parser (possibly wrapped into `functools.partial`).
+    :return: True if the raw values must not be recorded, False otherwise.
+    """
+    func = parser.func if isinstance(parser, partial) else parser
+    return func in _SECRET_PARSERS
+
+
+class Provenance(NamedTuple):
+    """
+    Represents where the value of a member comes from.
+    """
+
+    path: str
+    """The dotted path of the member."""
+
+    source: str
+    """The source of the value: "environment", "default", "default_factory",
+    "value" (a plain class attribute), "computed" (a property or a derived lazy value),
+    "section" or "unresolved" (a lazy value that is not resolved yet)."""
+
+    layer: str
+    """The full name of the class that defines the member (the override that won)."""
+
+    name: Optional[str] = None
+    """The name of the environment variable (with prefix applied), if any."""
+
+    raw: Optional[str] = None
+    """The raw string value of the environment variable, if it was set (omitted for binary
+    and DSN values, which may hold secrets)."""
+
+    timestamp: Optional[float] = None
+    """The time (as in `time.time()`) the value was resolved, if it was read from an environment."""
+
+
+class ProvenanceTable:
+    """
+    Represents a side table of records of environment lookups.
+
+    Records are stored in parallel arrays instead of on the values. An eager lookup only
+    replaces the last lookup, it becomes a record once its value is assigned in a class body
+    right after it. Lazy lookups are recorded by the environment (held weakly) and
+    the variable name (one record per variable, updated on every resolution). Records of
+    collected environments and classes are reused.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty ProvenanceTable.
+        """
+        self._names: List[str] = []
+        self._raws: List[Optional[str]] = []
+        self._sources = array("B")
+        self._timestamps = array("d")
+        self._lookups = 0
+        self._last: Optional[Tuple[str, Optional[str], int, Any]] = None
+        self._lazy: "WeakKeyDictionary[Any, Dict[str, int]]" = WeakKeyDictionary()
+        self._secrets: "WeakKeyDictionary[Any, Set[str]]" = WeakKeyDictionary()
+        self._members: "WeakKeyDictionary[Any, Dict[str, int]]" = WeakKeyDictionary()
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        """
+        Get the number of records (including the ones free for reuse).
+
+        :return: The number of records.
+        """
+        return len(self._names)
+
+    def _owned_by(self, owner: Any,
+                  table: "WeakKeyDictionary[Any, Dict[str, int]]") -> Dict[str, int]:
+        """
+        Get the records of an owner (an environment or a class), freeing them for reuse
+        once the owner is collected.
+
+        :param owner: The owner of the records.
+        :param table: The table of records by owner.
+        :return: A dictionary of keys (variable names or member keys) to indexes of records.
+        """
+        records = table.get(owner)
+        if records is None:
+            records = table[owner] = {}
+            finalize(owner, self._release, records)
+        return records
+
+    def _release(self, records: Dict[str, int]) -> None:
+        """
+        Free records for reuse.
+
+        :param records: A dictionary of keys to indexes of records.
+        """
+        self._free.extend(records.values())
+
+    @property
+    def lookups(self) -> int:
+        """
+        Get the number of eager lookups made so far.
+
+        :return: The number of eager lookups.
+        """
+        return self._lookups
+
+    def record(self, name: str, raw: Optional[str], source: int) -> int:
+        """
+        Add a record of an environment lookup.
+
+        :param name: The name of the environment variable.
+        :param raw: The raw string value (None if the variable is not set or may hold a secret).
+        :param source: The source of the value (ENVIRONMENT, DEFAULT or DEFAULT_FACTORY).
+        :return: The index of the record.
+        """
+        if len(self._free) > 0:
+            index = self._free.pop()
+            self._names[index] = name
+            self._raws[index] = raw
+            self._sources[index] = source
+            self._timestamps[index] = time.time()
+            return index
+        self._names.append(name)
+        self._raws.append(raw)
+        self._sources.append(source)
+        self._timestamps.append(time.time())
+        return len(self._names) - 1
+
+    def record_eager(self, name: str, raw: Optional[str], source: int, value: Any) -> None:
+        """
+        Remember an eager lookup until the next one (see `take`).
+
+        :param name: The name of the environment variable.
+        :param raw: The raw string value (None if the variable is not set or may hold a secret).
+        :param source: The source of the value (ENVIRONMENT, DEFAULT or DEFAULT_FACTORY).
+        :param value: The resulting value.
+        """
+        self._lookups += 1
+        self._last = (name, raw, source, value)
+
+    def take(self, value: Any, since: int) -> Optional[int]:
+        """
+        Turn the last eager lookup into a record if the value assigned is the one it returned.
+
+        :param value: The value being assigned.
+        :param since: The number of eager lookups at the previous assignment.
+        :return: The index of the record, or None if the value does not come from the lookup.
+        """
+        if (self._last is None) or (self._lookups <= since) or (self._last[3] is not value):
+            return None
+        name, raw, source, _ = self._last
+        self._last = None
+        return self.record(name, raw, source)
+
+    def record_lazy(self, env: Any, name: str, raw: Optional[str], source: int) -> None:
+        """
+        Add (or update) a record of a lazy lookup.
+
+        :param env: The environment the variable is read from.
+        :param name: The name of the environment variable.
+        :param raw: The raw string value (None if the variable is not set or may hold a secret).
+        :param source: The source of the value (ENVIRONMENT, DEFAULT or DEFAULT_FACTORY).
+        """
+        if name in self._secrets.get(env, ()):
+            raw = None
+        records = self._owned_by(env, self._lazy)
+        index = records.get(name)
+        if index is None:
+            records[name] = self.record(name, raw, source)
+        else:
+            self._raws[index] = raw
+            self._sources[index] = source
+            self._timestamps[index] = time.time()
+
+    def bind(self, section: Any, members: Dict[str, int]) -> None:
+        """
+        Bind records to the members of a class.
+
+        :param section: The class the members belong to.
+        :param members: A dictionary of keys to indexes of records.
+        """
+        if len(members) > 0:
+            self._owned_by(section, self._members).update(members)
+
+    def find(self, section: Any, key: str) -> Optional[int]:
+        """
+        Find the record bound to a member.
+
+        :param section: The class the member belongs to.
+        :param key: The key of the member.
+        :return: The index of the record, or None if there is none.
+        """
+        return self._members.get(section, {}).get(key)
+
+    def find_lazy(self, env: Any, name: str) -> Optional[int]:
+        """
+        Find the record of a lazy lookup.
+
+        :param env: The environment the variable is read from.
+        :param name: The name of the environment variable.
+        :return: The index of the record, or None if the variable was not resolved yet.
+        """
+        return self._lazy.get(env, {}).get(name)
+
+    def redact(self, section: Any, key: str) -> None:
+        """
+        Forget the raw value of the record bound to a member (e.g. a DSN inferred from
+        the annotation).
+
+        :param section: The class the member belongs to.
+        :param key: The key of the member.
+        """
+        index = self.find(section, key)
+        if index is not None:
+            self._raws[index] = None
+
+    def redact_lazy(self, env: Any, name: str) -> None:
+        """
+        Never record the raw value of a lazy lookup (e.g. a DSN inferred from the annotation).
+
+        :param env: The environment the variable is read from.
+        :param name: The name of the environment variable.
+        """
+        self._secrets.setdefault(env, set()).add(name)
+        index = self.find_lazy(env, name)
+        if index is not None:
+            self._raws[index] = None
+
+    def describe(self, index: int) -> Tuple[str, str, Optional[str], float]:
+        """
+        Get the fields of a record.
+
+        :param index: The index of the record.
+        :return: The source name, the variable name, the raw value and the timestamp.
+        """
+        return (_SOURCE_NAMES[self._sources[index]], self._names[index],
+                self._raws[index], self._timestamps[index])
+
+
+PROVENANCE = ProvenanceTable()
@@ -0,0 +1,237 @@
+import inspect
+from typing import Any, Dict, ItemsView, Iterator, Mapping, Optional, Tuple, ValuesView
+
+__all__ = ("FrozenSection", "SectionItemsView", "SectionValuesView",)
+
+
+def _get_value(section: Any, key: str, *, resolve: bool) -> Any:
+    """
+    Get a member of a section, storing an error raised while resolving it as its value.
+
+    :param section: The section (or config) class.
+    :param key: The key of the member.
+    :param resolve: Whether to resolve the member (otherwise the raw member is returned).
+    :return: The (resolved) value of the member or the error.
+    """
+    if not resolve:
+        return inspect.getattr_static(section, key)
+    try:
+        return getattr(section, key)
+    except Exception as e:
+        return e
+
+
+class SectionValuesView(ValuesView[Any]):
+    """
+    Represents a view over the values of a section.
+
+    The values are resolved one by one, only when they are yielded. An error raised
+    while resolving a value is yielded in its place.
+    """
+
+    def __init__(self, section: Any, *, resolve: bool = True) -> None:
+        """
+        Initialize the SectionValuesView with a section.
+
+        :param section: The section (or config) class.
+        :param resolve: Whether to resolve the values (default is True).
+        """
+        super().__init__(section)
+        self._section = section
+        self._resolve = resolve
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the values of the section.
+
+        :return: An iterator over the (resolved) values.
+        """
+        section = self._section
+        for key in section:
+            yield _get_value(section, key, resolve=self._resolve)
+
+    def __contains__(self, value: object) -> bool:
+        """
+        Check if a value is present in the section.
+
+        :param value: The value to check.
+        :return: True if the value is present, False otherwise.
+        """
+        return any((val is value) or (val == value) for val in self)
+
+    def __repr__(self) -> str:
+        """
+        Get a string representation of the view.
+
+        :return: A string representation that does not resolve the values.
+        """
+        return f"{type(self).__name__}(<{self._section.__name__}>)"
+
+
+class SectionItemsView(ItemsView[str, Any]):
+    """
+    Represents a view over the items of a section.
+
+    The values are resolved one by one, only when they are yielded. An error raised
+    while resolving a value is yielded in its place.
+    """
+
+    def __init__(self, section: Any, *, resolve: bool = True) -> None:
+        """
+        Initialize the SectionItemsView with a section.
+
+        :param section: The section (or config) class.
+        :param resolve: Whether to resolve the values (default is True).
+        """
+        super().__init__(section)
+        self._section = section
+        self._resolve = resolve
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the items of the section.
+
+        :return: An iterator over the (key, resolved value) pairs.
+        """
+        section = self._section
+        for key in section:
+            yield key, _get_value(section, key, resolve=self._resolve)
+
+    def __contains__(self, item: object) -> bool:
+        """
+        Check if a (key, value) pair is present in the section.
+
+        Only the value of the given key is resolved.
+
+        :param item: The (key, value) pair to check.
+        :return: True if the pair is present, False otherwise.
+        """
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+        key, value = item
+        if key not in self._section:
+            return False
+        val = _get_value(self._section, key, resolve=self._resolve)
+        return (val is value) or bool(val == value)
+
+    def __repr__(self) -> str:
+        """
+        Get a string representation of the view.
+
+        :return: A string representation that does not resolve the values.
+        """
+        return f"{type(self).__name__}(<{self._section.__name__}>)"
+
+
+class FrozenSection(Mapping[str, Any]):
+    """
+    Represents a resolved, immutable snapshot of a section.
+
+    Snapshots with equal values are equal and have equal hashes, regardless of the section
+    they were taken from, so they can be used as keys (e.g. for `functools.lru_cache`).
+    Nested sections are snapshotted as nested FrozenSection instances.
+    """
+
+    __slots__ = ("_name", "_values", "_hash",)
+
+    def __init__(self, name: str, values: Dict[str, Any]) -> None:
+        """
+        Initialize the FrozenSection with resolved values.
+
+        :param name: The full name of the section.
+        :param values: A dictionary of keys to resolved values.
+        """
+        self._name = name
+        self._values = values
+        self._hash: Optional[int] = None
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Retrieve a value by key.
+
+        :param key: The key of the value.
+        :return: The resolved value.
+        :raises KeyError: If the key does not exist.
+        """
+        return self._values[key]
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Retrieve a value by attribute access.
+
+        :param name: The key of the value.
+        :return: The resolved value.
+        :raises AttributeError: If the key does not exist.
+        """
+        if (name[:2] == name[-2:] == "__") or (name in FrozenSection.__slots__):
+            raise AttributeError(name)  # not set yet (e.g. while copying) or a protocol lookup
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(f"{name!r} does not exist in <{self._name}>") from None
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the keys.
+
+        :return: An iterator over the keys.
+        """
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """
+        Get the number of values.
+
+        :return: The number of values.
+        """
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Check if the snapshot has the same keys and values as another snapshot.
+
+        :param other: The object to compare with.
+        :return: True if the snapshots are equal, False otherwise.
+        """
+        if not isinstance(other, FrozenSection):
+            return NotImplemented
+        if self is other:
+            return True
+        if hash(self) != hash(other):
+            return False
+        return self._values == other._values
+
+    def __hash__(self) -> int:
+        """
+        Get the hash of the snapshot, computed once.
+
+        Unhashable values (e.g. lists) contribute only their type and size.
+
+        :return: The hash of the keys and values.
+        """
+        if self._hash is None:
+            items = []
+            for key, value in self._values.items():
+                try:
+                    items.append((key, hash(value)))
+                except TypeError:
+                    size = len(value) if hasattr(value, "__len__") else 0
+                    items.append((key, hash((type(value).__name__, size))))
+            self._hash = hash(tuple(items))
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str, Dict[str, Any]]]:
+        """
+        Support copying and pickling of the snapshot.
+
+        :return: The class and the arguments to rebuild the snapshot.
+        """
+        return FrozenSection, (self._name, self._values)
+
+    def __repr__(self) -> str:
+        """
+        Get a string representation of the snapshot.
+
+        :return: A string representation with the name and the values.
+        """
+        return f"FrozenSection(<{self._name}>, {self._values!r})"
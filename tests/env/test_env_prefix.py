@@ -0,0 +1,135 @@
+from typing import List, Tuple
+
+from pytest import raises
+
+import cabina
+from cabina.errors import ConfigEnvError, ConfigError
+
+
+def test_env_prefix_section():
+    environ = {"APP__HOST": "localhost", "APP__PORT": "8080", "OTHER__HOST": "127.0.0.1"}
+
+    class Config(cabina.Config, cabina.Section):
+        __env_prefix__ = "APP__"
+        __environ__ = environ
+
+        HOST: str
+        PORT: int
+
+    assert Config.HOST == "localhost"
+    assert Config.PORT == 8080
+    assert list(Config) == ["HOST", "PORT"]
+
+
+def test_env_prefix_nested_sections():
+    environ = {
+        "APP__DEBUG": "yes",
+        "APP__DB__HOST": "db.local",
+        "APP__DB__PORT": "5432",
+        "APP__DB__POOL__SIZE": "10",
+        "APP__DB__UNKNOWN": "ignored",
+    }
+
+    class Config(cabina.Config):
+        class App(cabina.Section):
+            __env_prefix__ = "APP__"
+            __environ__ = environ
+
+            DEBUG: bool
+
+            class Db(cabina.Section):
+                HOST: str
+                PORT: int
+
+                class Pool(cabina.Section):
+                    SIZE: int
+
+    assert Config.App.DEBUG is True
+    assert Config.App.Db.HOST == "db.local"
+    assert Config.App.Db.PORT == 5432
+    assert Config.App.Db.Pool.SIZE == 10
+    assert "UNKNOWN" not in Config.App.Db
+
+
+def test_env_prefix_defaults():
+    environ = {"APP__PORT": "9090"}
+
+    class Section(cabina.Section):
+        __env_prefix__ = "APP__"
+        __environ__ = environ
+
+        HOST: str = "localhost"
+        PORT: int = 8080
+
+    assert Section.HOST == "localhost"
+    assert Section.PORT == 9090
+
+
+def test_env_prefix_custom_delimiter():
+    environ = {"APP_DB_HOST": "db.local"}
+
+    class Section(cabina.Section):
+        __env_prefix__ = "APP_"
+        __env_delimiter__ = "_"
+        __environ__ = environ
+
+        class Db(cabina.Section):
+            HOST: str
+
+    assert Section.Db.HOST == "db.local"
+
+
+def test_env_prefix_errors():
+    environ = {"APP__DB__PORT": "number"}
+
+    with raises(Exception) as exc_info:
+        class Config(cabina.Config, cabina.Section):
+            __env_prefix__ = "APP__"
+            __environ__ = environ
+
+            class Db(cabina.Section):
+                HOST: str
+                PORT: int
+
+    message = "\n".join([
+        "Failed to fetch:",
+        "- Config.Db.HOST: 'APP__DB__HOST' does not exist",
+        "- Config.Db.PORT: Failed to parse 'number' as int",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_env_prefix_postponed_annotations():
+    class Config(cabina.Config, cabina.Section):
+        __env_prefix__ = "APP__"
+        __environ__ = {"APP__PORT": "8080", "APP__HOSTS": "a,b"}
+
+        PORT: "int"
+        HOSTS: "Tuple[str, ...]"
+
+    assert Config.PORT == 8080
+    assert Config.HOSTS == ("a", "b")
+
+
+def test_env_prefix_unsupported_annotation_with_value():
+    class Config(cabina.Config, cabina.Section):
+        __env_prefix__ = "APP__"
+        __environ__ = {"APP__HOSTS": "a,b"}
+
+        HOSTS: List[str] = []
+
+    assert Config.HOSTS == []
+
+
+def test_env_prefix_unsupported_annotation_without_value():
+    with raises(Exception) as exc_info:
+        class Config(cabina.Config, cabina.Section):
+            __env_prefix__ = "APP__"
+            __environ__ = {"APP__HOSTS": "a,b"}
+
+            HOSTS: List[str]
+
+    assert exc_info.type is ConfigError
+    assert str(exc_info.value) == ("Attempted to map 'HOSTS' of unsupported type "
+                                   "typing.List[str] in <Config>")
@@ -1,7 +1,10 @@
+from array import array
+
 from pytest import raises
 
 from cabina import Environment
-from cabina.errors import EnvKeyError
+from cabina.errors import ConfigEnvError, EnvKeyError, EnvParseError
+from cabina.parsers import parse_int
 
 
 def test_env_value_get():
@@ -167,3 +170,271 @@ def test_env_prefix():
     env = Environment({"APP_NAME": "banana"}, prefix="APP_")
     assert env("NAME") == "banana"
     assert env.get("NAME") == "banana"
+
+
+def test_env_many():
+    env = Environment({"HOST": "localhost ", "PORT": "8080", "DEBUG": "yes"})
+
+    values = env.many({"HOST": str, "PORT": int, "DEBUG": bool})
+    assert values == {"HOST": "localhost", "PORT": 8080, "DEBUG": True}
+
+
+def test_env_many_custom_parsers():
+    env = Environment({"PORT": "ff", "RAW": " raw "})
+
+    values = env.many({"PORT": lambda x: parse_int(x, base=16), "RAW": lambda x: x})
+    assert values == {"PORT": 255, "RAW": " raw "}
+
+
+def test_env_many_with_defaults():
+    env = Environment({"HOST": "localhost"})
+
+    values = env.many({"HOST": str, "PORT": int}, defaults={"PORT": 8080})
+    assert values == {"HOST": "localhost", "PORT": 8080}
+
+
+def test_env_many_with_prefix():
+    env = Environment({"APP_HOST": "localhost"}, prefix="APP_")
+
+    values = env.many({"HOST": str})
+    assert values == {"HOST": "localhost"}
+
+
+def test_env_many_errors():
+    env = Environment({"PORT": "number", "DEBUG": "yes", "TIMEOUT": "1.5s"})
+
+    with raises(Exception) as exc_info:
+        env.many({"HOST": str, "PORT": int, "DEBUG": bool, "TIMEOUT": float})
+
+    message = "\n".join([
+        "Failed to fetch:",
+        "- HOST: 'HOST' does not exist",
+        "- PORT: Failed to parse 'number' as int",
+        "- TIMEOUT: Failed to parse '1.5s' as float",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_env_many_errors_in_declaration_order():
+    env = Environment({"PORT": "number", "TIMEOUT": "1.5s"})
+
+    with raises(Exception) as exc_info:
+        env.many({"TIMEOUT": float, "HOST": str, "PORT": int})
+
+    message = "\n".join([
+        "Failed to fetch:",
+        "- TIMEOUT: Failed to parse '1.5s' as float",
+        "- HOST: 'HOST' does not exist",
+        "- PORT: Failed to parse 'number' as int",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_env_namespace():
+    env = Environment({"FEATURE_A": "yes", "FEATURE_B": "no", "FEATURES": "all", "DEBUG": "1"})
+
+    values = env.namespace("FEATURE_")
+    assert values == {"FEATURE_A": "yes", "FEATURE_B": "no"}
+
+
+def test_env_namespace_read_only():
+    env = Environment({"FEATURE_A": "yes"})
+
+    values = env.namespace("FEATURE_")
+    with raises(TypeError):
+        values["FEATURE_A"] = "no"  # type: ignore
+
+
+def test_env_namespace_strip_with_parser():
+    env = Environment({"APP_SHARD_1": "10", "APP_SHARD_2": "20", "SHARD_3": "30"}, prefix="APP_")
+
+    values = env.namespace("SHARD_", strip=True, parser=parse_int)
+    assert values == {"1": 10, "2": 20}
+
+
+def test_env_namespace_empty():
+    env = Environment({"DEBUG": "1"})
+    assert env.namespace("FEATURE_") == {}
+
+
+def test_env_namespace_reindex():
+    environ = {"FEATURE_A": "yes"}
+    env = Environment(environ)
+    assert env.namespace("FEATURE_") == {"FEATURE_A": "yes"}
+
+    environ["FEATURE_B"] = "no"
+    assert env.namespace("FEATURE_") == {"FEATURE_A": "yes", "FEATURE_B": "no"}
+
+
+def test_env_namespace_reindex_replaced_name():
+    environ = {"DEBUG": "1", "FEATURE_X": "yes"}
+    env = Environment(environ)
+    assert env.namespace("FEATURE_") == {"FEATURE_X": "yes"}
+
+    del environ["DEBUG"]
+    environ["FEATURE_Y"] = "no"
+    assert env.namespace("FEATURE_") == {"FEATURE_X": "yes"}
+
+    env.refresh()
+    assert env.namespace("FEATURE_") == {"FEATURE_X": "yes", "FEATURE_Y": "no"}
+
+
+def test_env_namespace_invalid_value():
+    env = Environment({"SHARD_1": "10", "SHARD_2": "banana"})
+
+    with raises(Exception) as exc_info:
+        env.namespace("SHARD_", parser=parse_int)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse 'SHARD_2': Failed to parse 'banana' as int"
+
+
+def test_env_iter():
+    env = Environment({"<key>": "1, 2, 3"})
+
+    value = env.iter("<key>", subparser=parse_int)
+    assert list(value) == [1, 2, 3]
+
+
+def test_env_iter_default():
+    env = Environment({})
+    assert env.iter("<key>", default=()) == ()
+
+
+def test_env_iter_incorrect_default():
+    env = Environment({})
+    with raises(AssertionError):
+        env.iter("<key>", default=None)
+
+
+def test_env_frozenset():
+    env = Environment({"<key>": "first second first"})
+
+    value = env.frozenset("<key>", separator=" ")
+    assert value == frozenset({"first", "second"})
+
+
+def test_env_frozenset_incorrect_default():
+    env = Environment({})
+    with raises(AssertionError):
+        env.frozenset("<key>", default=set())
+
+
+def test_env_array():
+    env = Environment({"<key>": "1, 2, 3"})
+
+    value = env.array("<key>", typecode="i")
+    assert value == array("i", [1, 2, 3])
+
+
+def test_env_array_incorrect_default():
+    env = Environment({})
+    with raises(AssertionError):
+        env.array("<key>", default=(1.0,))
+
+
+def test_env_bytes():
+    env = Environment({"<key>": "YmFuYW5h"})
+
+    value = env.bytes("<key>")
+    assert value == b"banana"
+
+
+def test_env_bytes_hex_view():
+    env = Environment({"<key>": "00ff"})
+
+    value = env.bytes("<key>", encoding="hex", view=True)
+    assert isinstance(value, memoryview)
+    assert value.tobytes() == b"\x00\xff"
+
+
+def test_env_bytes_raw_environb(monkeypatch):
+    monkeypatch.setenv("CABINA_TEST_KEY", " banana ")
+    env = Environment(prefix="CABINA_TEST_")
+
+    assert env.bytes("KEY", encoding="raw") == b" banana "
+    assert env.bytes("NONEXISTING", default=b"", encoding="raw") == b""
+
+
+def test_env_bytes_nonexisting_key():
+    env = Environment({})
+
+    with raises(Exception) as exc_info:
+        env.bytes("<key>")
+
+    assert exc_info.type is EnvKeyError
+    assert str(exc_info.value) == "'<key>' does not exist"
+
+
+def test_env_bytes_incorrect_default():
+    env = Environment({})
+    with raises(AssertionError):
+        env.bytes("<key>", default="")
+
+
+def test_env_file(tmp_path):
+    path = tmp_path / "port"
+    path.write_text("8080")
+    env = Environment({"PORT_FILE": str(path)})
+
+    assert env.file("PORT_FILE", parser=parse_int) == 8080
+    assert env.file("PORT_FILE", mode="mmap", parser=bytes) == b"8080"
+    assert env.file("NONEXISTING_FILE", default=None) is None
+
+
+def test_env_json():
+    env = Environment({"<key>": '{"types": ["image/png"]}'})
+
+    assert env.json("<key>") == {"types": ["image/png"]}
+    assert env.json("<key>", freeze=True) == {"types": ("image/png",)}
+    assert env.json("<nonexisting>", default={}) == {}
+    assert env.json("<key>", loads=lambda value: value) == '{"types": ["image/png"]}'
+
+
+def test_env_get_with_default_factory():
+    env = Environment({"<key>": "1"})
+    calls = []
+
+    def factory():
+        calls.append("factory")
+        return []
+
+    assert env.get("<key>", default_factory=factory) == "1"
+    assert calls == []
+
+    assert env.get("<missing>", default_factory=factory) == []
+    assert calls == ["factory"]
+
+
+def test_env_get_default_and_default_factory():
+    env = Environment({})
+    with raises(AssertionError):
+        env.get("<key>", default="banana", default_factory=lambda: "banana")
+
+
+def test_env_typed_getters_with_default_factory():
+    env = Environment({})
+
+    assert env.none("<key>", default_factory=lambda: None) is None
+    assert env.bool("<key>", default_factory=lambda: True) is True
+    assert env.int("<key>", default_factory=lambda: 42) == 42
+    assert env.float("<key>", default_factory=lambda: 3.14) == 3.14
+    assert env.str("<key>", default_factory=lambda: "banana") == "banana"
+    assert env.tuple("<key>", default_factory=lambda: (1, 2)) == (1, 2)
+    assert list(env.iter("<key>", default_factory=lambda: [1, 2])) == [1, 2]
+    assert env.frozenset("<key>", default_factory=frozenset) == frozenset()
+    assert env.array("<key>", default_factory=lambda: array("d")) == array("d")
+    assert env.bytes("<key>", default_factory=lambda: b"\x00") == b"\x00"
+    assert env.file("<key>", default_factory=lambda: "contents") == "contents"
+    assert env.json("<key>", default_factory=dict) == {}
+
+
+def test_env_typed_getter_default_factory_existing_key():
+    env = Environment({"<key>": "42"})
+
+    def factory():
+        raise AssertionError("must not be called")
+
+    assert env.int("<key>", default_factory=factory) == 42
@@ -1,7 +1,9 @@
+import time
+
 from pytest import raises
 
 import cabina
-from cabina import LazyEnvironment
+from cabina import LazyEnvironment, combine
 from cabina.errors import ConfigEnvError, EnvKeyError
 
 
@@ -115,3 +117,421 @@ def test_lazy_env_config_prefetch_with_sections():
     ])
     assert exc_info.type is ConfigEnvError
     assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_many():
+    env = LazyEnvironment({"PORT": "number"})
+    values = env.many({"HOST": str, "PORT": int})
+
+    class Config(cabina.Config, cabina.Section):
+        API_HOST = values["HOST"]
+        API_PORT = values["PORT"]
+
+    with raises(Exception) as exc_info:
+        Config.prefetch()
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.API_HOST: 'HOST' does not exist",
+        "- Config.API_PORT: Failed to parse 'number' as int",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_map():
+    env = LazyEnvironment({"PORT": "8080"})
+
+    class Config(cabina.Config, cabina.Section):
+        API_ADDR = env.int("PORT").map(lambda port: ("localhost", port))
+
+    assert Config.API_ADDR == ("localhost", 8080)
+
+
+def test_lazy_env_config_map_refetch():
+    environ = {"PORT": "8080"}
+    env = LazyEnvironment(environ)
+    port = env.int("PORT")
+
+    class Config(cabina.Config, cabina.Section):
+        API_ADDR = port.map(lambda port: ("localhost", port))
+
+    assert Config.API_ADDR == ("localhost", 8080)
+
+    environ["PORT"] = "9090"
+    port.fetch()
+    assert Config.API_ADDR == ("localhost", 9090)
+
+
+def test_lazy_env_config_combine():
+    env = LazyEnvironment({"HOST": "localhost", "PORT": "8080"})
+
+    class Config(cabina.Config, cabina.Section):
+        API_URL = combine(env.str("HOST"), env.int("PORT"),
+                          lambda host, port: f"http://{host}:{port}")
+
+    assert Config.API_URL == "http://localhost:8080"
+
+
+def test_lazy_env_config_prefetch_with_derived_values():
+    env = LazyEnvironment({"PORT": "number"})
+
+    class Config(cabina.Config, cabina.Section):
+        API_ADDR = env.int("PORT").map(lambda port: ("localhost", port))
+        API_URL = combine(env.str("HOST"), env.int("PORT"),
+                          lambda host, port: f"http://{host}:{port}")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch()
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.API_ADDR: Failed to parse 'number' as int",
+        "- Config.API_URL: 'HOST' does not exist",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_include():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+            PORT = env.int("DB_PORT")
+
+        class Cache(cabina.Section):
+            URL = env.str("CACHE_URL")
+
+            class Local(cabina.Section):
+                SIZE = env.int("CACHE_SIZE")
+
+        class Cron(cabina.Section):
+            SCHEDULE = env.str("CRON_SCHEDULE")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(include=["Db.*", "Cache"])
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.Db.HOST: 'DB_HOST' does not exist",
+        "- Config.Db.PORT: 'DB_PORT' does not exist",
+        "- Config.Cache.URL: 'CACHE_URL' does not exist",
+        "- Config.Cache.Local.SIZE: 'CACHE_SIZE' does not exist",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_include_nested_pattern():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+
+        class Cache(cabina.Section):
+            URL = env.str("CACHE_URL")
+
+            class Local(cabina.Section):
+                SIZE = env.int("CACHE_SIZE")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(include=["*.SIZE", "TZ"])
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.TZ: 'TZ' does not exist",
+        "- Config.Cache.Local.SIZE: 'CACHE_SIZE' does not exist",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_exclude():
+    env = LazyEnvironment({"TZ": "UTC", "DB_PORT": "5432"})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+            PORT = env.int("DB_PORT")
+
+        class Cache(cabina.Section):
+            URL = env.str("CACHE_URL")
+
+        class Cron(cabina.Section):
+            SCHEDULE = env.str("CRON_SCHEDULE")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(exclude=["Db.PORT", "Cache", "Cron.*"])
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.Db.HOST: 'DB_HOST' does not exist",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_include_and_exclude():
+    env = LazyEnvironment({"DB_HOST": "localhost", "DB_PORT": "5432"})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+            PORT = env.int("DB_PORT")
+
+        class Cache(cabina.Section):
+            URL = env.str("CACHE_URL")
+
+            class Local(cabina.Section):
+                SIZE = env.int("CACHE_SIZE")
+
+    Config.prefetch(include=["Db", "Cache.Local.*"], exclude=["Cache.Local.SIZE"])
+
+
+def test_lazy_env_config_prefetch_roles():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            __roles__ = ("api", "consumer")
+            HOST = env.str("DB_HOST")
+            PORT = env.int("DB_PORT")
+
+        class Cache(cabina.Section):
+            __roles__ = ("api",)
+            URL = env.str("CACHE_URL")
+
+            class Local(cabina.Section):
+                SIZE = env.int("CACHE_SIZE")
+
+        class Cron(cabina.Section):
+            __roles__ = ("cron",)
+            SCHEDULE = env.str("CRON_SCHEDULE")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(roles=["consumer"])
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.TZ: 'TZ' does not exist",
+        "- Config.Db.HOST: 'DB_HOST' does not exist",
+        "- Config.Db.PORT: 'DB_PORT' does not exist",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_roles_and_include():
+    env = LazyEnvironment({"CRON_SCHEDULE": "* * * * *"})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            __roles__ = ("api", "consumer")
+            HOST = env.str("DB_HOST")
+
+        class Cron(cabina.Section):
+            __roles__ = ("cron",)
+            SCHEDULE = env.str("CRON_SCHEDULE")
+
+    Config.prefetch(roles=["cron"], include=["Cron.*"])
+    assert Config.Cron.SCHEDULE == "* * * * *"
+
+
+def test_lazy_env_config_prefetch_single_string():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            __roles__ = ("consumer",)
+            HOST = env.str("DB_HOST")
+
+        class Cache(cabina.Section):
+            __roles__ = ("api",)
+            URL = env.str("CACHE_URL")
+
+            class Local(cabina.Section):
+                SIZE = env.int("CACHE_SIZE")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(roles="api", include="Cache.*", exclude="Cache.Local")
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.Cache.URL: 'CACHE_URL' does not exist",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_single_role_tag():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config, cabina.Section):
+        class Db(cabina.Section):
+            __roles__ = "api"
+            HOST = env.str("DB_HOST")
+
+        class Cron(cabina.Section):
+            __roles__ = "cron"
+            SCHEDULE = env.str("CRON_SCHEDULE")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(roles=["api"])
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.Db.HOST: 'DB_HOST' does not exist",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+    Config.prefetch(roles=["a"])
+
+
+def test_lazy_env_config_prefetch_skips_unselected():
+    env = LazyEnvironment({"PORT": "8080"})
+    calls = []
+
+    def factory():
+        calls.append("factory")
+        return "localhost"
+
+    class Config(cabina.Config, cabina.Section):
+        HOST = env.str("HOST", default_factory=factory)
+        PORT = env.int("PORT")
+
+    Config.prefetch(include=["PORT"])
+    assert calls == []
+
+
+def test_lazy_env_config_prefetch_fail_fast():
+    env = LazyEnvironment({"TZ": "UTC"})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+            PORT = env.int("DB_PORT")
+
+        class Cache(cabina.Section):
+            URL = env.str("CACHE_URL")
+
+        class Cron(cabina.Section):
+            SCHEDULE = env.str("CRON_SCHEDULE")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(fail_fast=True, exclude=["Cache"])
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.Db.HOST: 'DB_HOST' does not exist",
+        "Not attempted (stopped after 1 error(s)):",
+        "- Config.Db.PORT",
+        "- Config.Cron.SCHEDULE",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_max_errors():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+            PORT = env.int("DB_PORT")
+
+        class Cron(cabina.Section):
+            SCHEDULE = env.str("CRON_SCHEDULE")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(max_errors=2, include=["TZ", "Db"])
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.TZ: 'TZ' does not exist",
+        "- Config.Db.HOST: 'DB_HOST' does not exist",
+        "Not attempted (stopped after 2 error(s)):",
+        "- Config.Db.PORT",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_max_errors_not_reached():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config, cabina.Section):
+        TZ = env.str("TZ")
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+            PORT = env.int("DB_PORT")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(max_errors=3, include=["Db"])
+
+    message = "\n".join([
+        "Failed to prefetch:",
+        "- Config.Db.HOST: 'DB_HOST' does not exist",
+        "- Config.Db.PORT: 'DB_PORT' does not exist",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+
+
+def test_lazy_env_config_prefetch_timeout():
+    calls = []
+
+    def slow():
+        calls.append("slow")
+        time.sleep(0.05)
+        return "value"
+
+    env = LazyEnvironment({"PORT": "8080"})
+
+    class Config(cabina.Config, cabina.Section):
+        HOST = env.str("HOST", default_factory=slow)
+        PORT = env.int("PORT")
+        TZ = env.str("TZ")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch(timeout=0.01)
+
+    message = "\n".join([
+        "Not attempted (timed out after 0.01s):",
+        "- Config.PORT",
+        "- Config.TZ",
+    ])
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == message
+    assert calls == ["slow"]
+
+
+def test_lazy_env_config_prefetch_within_timeout():
+    env = LazyEnvironment({"HOST": "localhost"})
+
+    class Config(cabina.Config, cabina.Section):
+        HOST = env.str("HOST")
+
+    Config.prefetch(timeout=60, fail_fast=True)
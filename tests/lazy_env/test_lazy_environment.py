@@ -1,9 +1,10 @@
+from array import array
 from typing import cast
 
 from pytest import raises
 
 from cabina import FutureValue, LazyEnvironment
-from cabina.errors import EnvKeyError
+from cabina.errors import EnvKeyError, EnvParseError
 
 
 def test_lazy_env_future_value_get():
@@ -200,3 +201,241 @@ def test_lazy_env_prefix():
     env = LazyEnvironment({"APP_NAME": "banana"}, prefix="APP_")
     assert env("NAME").get() == "banana"
     assert env.get("NAME") == "banana"
+
+
+def test_lazy_env_many():
+    environ = {"HOST": "localhost", "PORT": "8080"}
+    env = LazyEnvironment(environ)
+
+    values = env.many({"HOST": str, "PORT": int})
+    environ["PORT"] = "9090"
+
+    assert list(values) == ["HOST", "PORT"]
+    assert cast(FutureValue, values["PORT"]).get() == 9090
+    assert cast(FutureValue, values["HOST"]).get() == "localhost"
+
+
+def test_lazy_env_many_resolved_once():
+    environ = {"HOST": "localhost", "PORT": "8080"}
+    env = LazyEnvironment(environ)
+
+    values = env.many({"HOST": str, "PORT": int})
+    assert cast(FutureValue, values["HOST"]).get() == "localhost"
+
+    environ["PORT"] = "9090"
+    assert cast(FutureValue, values["PORT"]).get() == 8080
+
+
+def test_lazy_env_many_fetch():
+    environ = {"HOST": "localhost", "PORT": "8080"}
+    env = LazyEnvironment(environ)
+
+    values = env.many({"HOST": str, "PORT": int})
+    assert cast(FutureValue, values["PORT"]).get() == 8080
+
+    environ["PORT"] = "9090"
+    assert cast(FutureValue, values["PORT"]).get() == 8080
+    assert cast(FutureValue, values["PORT"]).fetch() == 9090
+
+
+def test_lazy_env_many_fetch_fresh_error():
+    environ = {"PORT": "number"}
+    env = LazyEnvironment(environ)
+
+    values = env.many({"PORT": int})
+
+    with raises(EnvParseError) as first:
+        cast(FutureValue, values["PORT"]).fetch()
+    with raises(EnvParseError) as second:
+        cast(FutureValue, values["PORT"]).fetch()
+    assert first.value is not second.value
+
+    environ["PORT"] = "8080"
+    assert cast(FutureValue, values["PORT"]).fetch() == 8080
+
+
+def test_lazy_env_many_errors():
+    env = LazyEnvironment({"PORT": "number"})
+
+    values = env.many({"HOST": str, "PORT": int})
+
+    with raises(Exception) as exc_info:
+        cast(FutureValue, values["HOST"]).get()
+    assert exc_info.type is EnvKeyError
+    assert str(exc_info.value) == "'HOST' does not exist"
+
+    with raises(Exception) as exc_info:
+        cast(FutureValue, values["PORT"]).get()
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse 'number' as int"
+
+
+def test_lazy_env_namespace():
+    environ = {"FEATURE_A": "yes"}
+    env = LazyEnvironment(environ, prefix="FEATURE_")
+
+    value = cast(FutureValue, env.namespace("", strip=True))
+    environ["FEATURE_B"] = "no"
+
+    assert value.get() == {"A": "yes", "B": "no"}
+
+
+def test_lazy_env_namespace_refresh():
+    environ = {"DEBUG": "1", "FEATURE_X": "yes"}
+    env = LazyEnvironment(environ)
+    assert cast(FutureValue, env.namespace("FEATURE_")).get() == {"FEATURE_X": "yes"}
+
+    del environ["DEBUG"]
+    environ["FEATURE_Y"] = "no"
+    env.refresh()
+
+    value = cast(FutureValue, env.namespace("FEATURE_"))
+    assert value.get() == {"FEATURE_X": "yes", "FEATURE_Y": "no"}
+
+
+def test_lazy_env_iter():
+    env = LazyEnvironment({"<key>": "first, second"})
+
+    value = cast(FutureValue, env.iter("<key>"))
+    assert list(value.get()) == ["first", "second"]
+
+
+def test_lazy_env_iter_incorrect_default():
+    env = LazyEnvironment({})
+    with raises(AssertionError):
+        env.iter("<key>", default=None)
+
+
+def test_lazy_env_frozenset():
+    env = LazyEnvironment({"<key>": "first, second"})
+
+    value = cast(FutureValue, env.frozenset("<key>"))
+    assert value.get() == frozenset({"first", "second"})
+
+
+def test_lazy_env_frozenset_incorrect_default():
+    env = LazyEnvironment({})
+    with raises(AssertionError):
+        env.frozenset("<key>", default=())
+
+
+def test_lazy_env_array():
+    env = LazyEnvironment({"<key>": "0.5 1.5"})
+
+    value = cast(FutureValue, env.array("<key>", separator=" "))
+    assert value.get() == array("d", [0.5, 1.5])
+
+
+def test_lazy_env_array_incorrect_default():
+    env = LazyEnvironment({})
+    with raises(AssertionError):
+        env.array("<key>", default=[])
+
+
+def test_lazy_env_bytes():
+    environ = {}
+    env = LazyEnvironment(environ)
+
+    value = cast(FutureValue, env.bytes("<key>", encoding="hex"))
+    environ["<key>"] = "00ff"
+
+    assert value.get() == b"\x00\xff"
+
+
+def test_lazy_env_bytes_default():
+    env = LazyEnvironment({})
+
+    value = cast(FutureValue, env.bytes("<key>", default=b"banana", view=True))
+    assert value.get() == b"banana"
+
+
+def test_lazy_env_bytes_incorrect_default():
+    env = LazyEnvironment({})
+    with raises(AssertionError):
+        env.bytes("<key>", default="")
+
+
+def test_lazy_env_file(tmp_path):
+    path = tmp_path / "routes"
+    env = LazyEnvironment({"ROUTES_FILE": str(path)})
+
+    value = cast(FutureValue, env.file("ROUTES_FILE", mode="bytes"))
+    path.write_bytes(b"/index")
+
+    assert value.get() == b"/index"
+
+
+def test_lazy_env_file_nonexisting(tmp_path):
+    path = str(tmp_path / "routes")
+    env = LazyEnvironment({"ROUTES_FILE": path})
+
+    value = cast(FutureValue, env.file("ROUTES_FILE", mode="mmap"))
+
+    with raises(Exception) as exc_info:
+        value.get()
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to read file {path!r} (No such file or directory)"
+
+
+def test_lazy_env_json():
+    env = LazyEnvironment({"<key>": "[1, 2]"})
+
+    value = cast(FutureValue, env.json("<key>", freeze=True))
+    assert value.get() == (1, 2)
+
+
+def test_lazy_env_get_with_default_factory():
+    env = LazyEnvironment({"<key>": "1"})
+
+    assert env.get("<key>", default_factory=list) == "1"
+    assert env.get("<missing>", default_factory=list) == []
+
+
+def test_lazy_env_raw_with_default_factory():
+    env = LazyEnvironment({})
+    calls = []
+
+    def factory():
+        calls.append("factory")
+        return {"key": "value"}
+
+    value = env.raw("<key>", default_factory=factory)
+    assert isinstance(value, FutureValue)
+    assert calls == []
+
+    assert value.get() == {"key": "value"}
+    assert value.get() is value.get()
+    assert calls == ["factory"]
+
+
+def test_lazy_env_raw_with_default_factory_existing_key():
+    env = LazyEnvironment({"<key>": "banana"})
+
+    def factory():
+        raise AssertionError("must not be called")
+
+    value = env.raw("<key>", default_factory=factory)
+    assert value.get() == "banana"
+
+
+def test_lazy_env_raw_default_and_default_factory():
+    env = LazyEnvironment({})
+    with raises(AssertionError):
+        env.raw("<key>", default="banana", default_factory=lambda: "banana")
+
+
+def test_lazy_env_typed_getters_with_default_factory():
+    env = LazyEnvironment({})
+
+    assert cast(FutureValue, env.none("<key>", default_factory=lambda: None)).get() is None
+    assert cast(FutureValue, env.bool("<key>", default_factory=lambda: True)).get() is True
+    assert cast(FutureValue, env.int("<key>", default_factory=lambda: 42)).get() == 42
+    assert cast(FutureValue, env.float("<key>", default_factory=lambda: 3.14)).get() == 3.14
+    assert cast(FutureValue, env.str("<key>", default_factory=lambda: "banana")).get() == "banana"
+    assert cast(FutureValue, env.tuple("<key>", default_factory=lambda: (1,))).get() == (1,)
+    assert cast(FutureValue, env.frozenset("<key>", default_factory=frozenset)).get() == frozenset()
+    empty = array("d")
+    assert cast(FutureValue, env.array("<key>", default_factory=lambda: empty)).get() is empty
+    assert cast(FutureValue, env.bytes("<key>", default_factory=lambda: b"\x00")).get() == b"\x00"
+    assert cast(FutureValue, env.json("<key>", default_factory=dict)).get() == {}
@@ -0,0 +1,65 @@
+from array import array
+
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_array
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("1.5", [1.5]),
+    ("1.5, 2, -3e2", [1.5, 2.0, -300.0]),
+    ("(1.5, 2,)", [1.5, 2.0]),
+])
+def test_parse_array(value, expected):
+    parsed = parse_array(value)
+    assert isinstance(parsed, array)
+    assert parsed.typecode == "d"
+    assert parsed.tolist() == expected
+
+
+@pytest.mark.parametrize(("typecode", "value", "expected"), [
+    ("b", "-128, 127", [-128, 127]),
+    ("i", "1, 2, 3", [1, 2, 3]),
+    ("Q", "18446744073709551615", [18446744073709551615]),
+    ("f", "0.5", [0.5]),
+])
+def test_parse_array_with_typecode(typecode, value, expected):
+    parsed = parse_array(value, typecode=typecode)
+    assert parsed.typecode == typecode
+    assert parsed.tolist() == expected
+
+
+def test_parse_array_with_separator():
+    assert parse_array("1 2 3", typecode="l", separator=" ").tolist() == [1, 2, 3]
+
+
+def test_parse_array_buffer():
+    parsed = parse_array("1, 2", typecode="i")
+    view = memoryview(parsed)
+    assert view.format == "i"
+    assert view.tolist() == [1, 2]
+
+
+@pytest.mark.parametrize(("typecode", "value", "message"), [
+    ("d", "", "Failed to parse item 0: Failed to parse '' as array of 'd'"),
+    ("d", "1, 2, x, y", "Failed to parse item 2: Failed to parse ' x' as array of 'd'"),
+    ("i", "1, 2.5", "Failed to parse item 1: Failed to parse ' 2.5' as array of 'i'"),
+    ("b", "1, 128", "Failed to parse item 1: Failed to parse ' 128' as array of 'b'"),
+    ("B", "-1", "Failed to parse item 0: Failed to parse '-1' as array of 'B'"),
+])
+def test_parse_invalid_array(typecode, value, message):
+    with raises(Exception) as exc_info:
+        parse_array(value, typecode=typecode)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == message
+
+
+def test_parse_array_unsupported_typecode():
+    with raises(Exception) as exc_info:
+        parse_array("a", typecode="u")
+
+    assert exc_info.type is ValueError
+    assert str(exc_info.value) == "Unsupported array typecode 'u'"
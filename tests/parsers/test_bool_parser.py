@@ -2,7 +2,7 @@ import pytest
 from pytest import raises
 
 from cabina.errors import EnvParseError
-from cabina.parsers import parse_bool
+from cabina.parsers import bool_parser, parse_bool
 
 
 @pytest.mark.parametrize("value", [
@@ -40,3 +40,34 @@ def test_parse_invalid_bool(value):
 
     assert exc_info.type is EnvParseError
     assert str(exc_info.value) == f"Failed to parse {value!r} as bool"
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("TRUE", True),
+    ("Off", False),
+    ("yEs", True),
+])
+def test_parse_bool_case_insensitive(value, expected):
+    assert parse_bool(value) is expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("enabled", True),
+    ("Disabled", False),
+    ("yes", True),
+    ("0", False),
+])
+def test_bool_parser_extended(value, expected):
+    parser = bool_parser(true=("Enabled",), false=("disabled",))
+    assert parser(value) is expected
+
+
+def test_bool_parser_extended_invalid():
+    parser = bool_parser(true=("enabled",))
+
+    with raises(Exception) as exc_info:
+        parser("disabled")
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse 'disabled' as bool"
+    assert parse_bool("yes") is True
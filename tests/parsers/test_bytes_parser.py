@@ -0,0 +1,52 @@
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_bytes
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("", b""),
+    ("YmFuYW5h", b"banana"),
+    (" AAEC/w== ", b"\x00\x01\x02\xff"),
+])
+def test_parse_bytes_base64(value, expected):
+    assert parse_bytes(value) == expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("", b""),
+    ("00ff", b"\x00\xff"),
+    ("DE AD be ef", b"\xde\xad\xbe\xef"),
+])
+def test_parse_bytes_hex(value, expected):
+    assert parse_bytes(value, encoding="hex") == expected
+
+
+def test_parse_bytes_raw():
+    assert parse_bytes(" banana ", encoding="raw") == b" banana "
+    assert parse_bytes("\udcff", encoding="raw") == b"\xff"
+
+
+@pytest.mark.parametrize(("value", "encoding"), [
+    ("YmFuYW5h*", "base64"),
+    ("YmFuYW5", "base64"),
+    ("ключ", "base64"),
+    ("0", "hex"),
+    ("zz", "hex"),
+])
+def test_parse_invalid_bytes(value, encoding):
+    with raises(Exception) as exc_info:
+        parse_bytes(value, encoding=encoding)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value).startswith(f"Failed to parse value as {encoding} bytes (")
+    assert value not in str(exc_info.value)
+
+
+def test_parse_bytes_unsupported_encoding():
+    with raises(Exception) as exc_info:
+        parse_bytes("banana", encoding="utf-8")
+
+    assert exc_info.type is ValueError
+    assert str(exc_info.value) == "Unsupported bytes encoding 'utf-8'"
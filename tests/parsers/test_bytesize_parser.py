@@ -0,0 +1,36 @@
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_bytesize
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("0", 0),
+    ("512", 512),
+    ("512B", 512),
+    ("1kb", 1_000),
+    ("1.5KB", 1_500),
+    ("10 KiB", 10_240),
+    ("1M", 1_000_000),
+    ("2Gi", 2 * 1024 ** 3),
+    ("1.1PB", 1_100_000_000_000_000),
+    ("3EiB", 3 * 1024 ** 6),
+])
+def test_parse_bytesize(value, expected):
+    assert parse_bytesize(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "KB",
+    "10XB",
+    "-1KB",
+    "1 000",
+])
+def test_parse_invalid_bytesize(value):
+    with raises(Exception) as exc_info:
+        parse_bytesize(value)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to parse {value!r} as byte size"
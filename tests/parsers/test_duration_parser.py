@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_duration
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("0", timedelta()),
+    ("10", timedelta(seconds=10)),
+    ("1.5", timedelta(seconds=1.5)),
+    ("10s", timedelta(seconds=10)),
+    ("500ms", timedelta(milliseconds=500)),
+    ("250us", timedelta(microseconds=250)),
+    ("1h30m", timedelta(hours=1, minutes=30)),
+    (".5h", timedelta(minutes=30)),
+    ("1W 2D", timedelta(weeks=1, days=2)),
+    ("2 days, 4 hours", timedelta(days=2, hours=4)),
+    ("5 minutes 3 seconds", timedelta(minutes=5, seconds=3)),
+    ("-5m", timedelta(minutes=-5)),
+    ("1:30", timedelta(minutes=1, seconds=30)),
+    ("01:30:00.5", timedelta(hours=1, minutes=30, seconds=0.5)),
+])
+def test_parse_duration(value, expected):
+    assert parse_duration(value) == expected
+
+
+def test_parse_duration_memoized():
+    assert parse_duration("1h") is parse_duration("1h")
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "h",
+    "10x",
+    "1h 30",
+    "1:2:3:4",
+    "1e100",
+    "nan",
+    "-NaN",
+    "inf",
+    "-infinity",
+])
+def test_parse_invalid_duration(value):
+    with raises(Exception) as exc_info:
+        parse_duration(value)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to parse {value!r} as duration"
@@ -0,0 +1,35 @@
+from enum import Enum
+
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_enum
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = 2
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("RED", Color.RED),
+    ("red", Color.RED),
+    (" GREEN", Color.GREEN),
+    ("2", Color.GREEN),
+])
+def test_parse_enum(value, expected):
+    assert parse_enum(value, enum=Color) is expected
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "Red",
+    "blue",
+])
+def test_parse_invalid_enum(value):
+    with raises(Exception) as exc_info:
+        parse_enum(value, enum=Color)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to parse {value!r} as Color"
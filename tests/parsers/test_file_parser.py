@@ -0,0 +1,128 @@
+import json
+
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_file, parse_int
+
+
+@pytest.fixture()
+def path(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes("42 ✓".encode())
+    return str(path)
+
+
+def test_parse_file_text(path):
+    assert parse_file(path) == "42 ✓"
+
+
+def test_parse_file_text_encoding(path):
+    assert parse_file(path, encoding="latin-1") == "42 â\x9c\x93"
+
+
+def test_parse_file_bytes(path):
+    assert parse_file(path, mode="bytes") == "42 ✓".encode()
+
+
+def test_parse_file_with_parser(path):
+    assert parse_file(path, parser=lambda x: parse_int(x[:2])) == 42
+
+
+def test_parse_file_mmap(path):
+    view = parse_file(path, mode="mmap")
+
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert view.tobytes() == "42 ✓".encode()
+
+
+def test_parse_file_mmap_with_parser(tmp_path):
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps({"/": "index"}))
+
+    def parser(view):
+        return json.loads(view.tobytes())
+
+    assert parse_file(str(path), mode="mmap", parser=parser) == {"/": "index"}
+    assert parse_file(str(path), mode="mmap", parser=lambda x: x[:2]).tobytes() == b'{"'
+
+
+def test_parse_file_mmap_parser_holding_view(tmp_path):
+    path = tmp_path / "routes"
+    path.write_bytes(b"/index")
+
+    class Routes:
+        def __init__(self, view):
+            self.view = view
+
+    view, size = parse_file(str(path), mode="mmap", parser=lambda x: (x, len(x)))
+    assert (view.tobytes(), size) == (b"/index", 6)
+
+    routes = parse_file(str(path), mode="mmap", parser=Routes)
+    assert routes.view.tobytes() == b"/index"
+
+
+def test_parse_file_mmap_parser_error(tmp_path):
+    path = tmp_path / "routes"
+    path.write_bytes(b"/index")
+
+    def parser(view):
+        raise EnvParseError("invalid routes")
+
+    with raises(Exception) as exc_info:
+        parse_file(str(path), mode="mmap", parser=parser)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "invalid routes"
+
+
+def test_parse_file_mmap_empty(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+
+    assert parse_file(str(path), mode="mmap").tobytes() == b""
+
+
+@pytest.mark.parametrize("mode", ["text", "bytes", "mmap"])
+def test_parse_file_max_size(path, mode):
+    assert parse_file(path, mode=mode, max_size=6, parser=len) > 0
+
+    with raises(Exception) as exc_info:
+        parse_file(path, mode=mode, max_size=5)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == (f"Failed to read file {path!r}: "
+                                   "size 6 exceeds limit of 5 bytes")
+
+
+@pytest.mark.parametrize("mode", ["text", "bytes", "mmap"])
+def test_parse_nonexisting_file(tmp_path, mode):
+    path = str(tmp_path / "nonexisting")
+
+    with raises(Exception) as exc_info:
+        parse_file(path, mode=mode)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to read file {path!r} (No such file or directory)"
+
+
+def test_parse_file_invalid_text(tmp_path):
+    path = tmp_path / "binary"
+    path.write_bytes(b"\xff")
+
+    with raises(Exception) as exc_info:
+        parse_file(str(path))
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == (f"Failed to decode file {str(path)!r} as utf-8 "
+                                   "(invalid start byte)")
+
+
+def test_parse_file_unsupported_mode(path):
+    with raises(Exception) as exc_info:
+        parse_file(path, mode="lines")
+
+    assert exc_info.type is ValueError
+    assert str(exc_info.value) == "Unsupported file mode 'lines'"
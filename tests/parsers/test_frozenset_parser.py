@@ -0,0 +1,36 @@
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_as_is, parse_frozenset, parse_int
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("banana", {"banana"}),
+    ("(first, second,)", {"first", "second"}),
+    ("first, second, first", {"first", "second"}),
+])
+def test_parse_frozenset(value, expected):
+    parsed = parse_frozenset(value)
+    assert isinstance(parsed, frozenset)
+    assert parsed == expected
+
+
+def test_parse_frozenset_with_subparser():
+    assert parse_frozenset("1 2 3", separator=" ", subparser=parse_int) == {1, 2, 3}
+
+
+def test_parse_invalid_frozenset():
+    with raises(Exception) as exc_info:
+        parse_frozenset("banana,,")
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse item 1: Failed to parse '' as non-empty str"
+
+
+def test_parse_frozenset_empty_separator():
+    with raises(Exception) as exc_info:
+        parse_frozenset("abc", separator="", subparser=parse_as_is)
+
+    assert exc_info.type is ValueError
+    assert str(exc_info.value) == "empty separator"
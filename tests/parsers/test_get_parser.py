@@ -0,0 +1,81 @@
+from datetime import timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Literal, Optional, Tuple, Union
+
+import pytest
+
+from cabina.parsers import (
+    get_parser,
+    parse_bool,
+    parse_duration,
+    parse_float,
+    parse_int,
+    parse_none,
+    parse_path,
+    parse_str,
+    register_parser,
+)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@pytest.mark.parametrize(("tp", "expected"), [
+    (str, parse_str),
+    (int, parse_int),
+    (float, parse_float),
+    (bool, parse_bool),
+    (None, parse_none),
+    (type(None), parse_none),
+    (Path, parse_path),
+    (timedelta, parse_duration),
+])
+def test_get_parser(tp, expected):
+    assert get_parser(tp) is expected
+
+
+@pytest.mark.parametrize(("tp", "value", "expected"), [
+    (Optional[int], "42", 42),
+    (Optional[int], "none", None),
+    (Tuple[int, ...], "1, 2", (1, 2)),
+    (Tuple[Optional[bool], ...], "yes,null", (True, None)),
+    (FrozenSet[int], "1, 2, 1", frozenset({1, 2})),
+    (Literal["debug", "info"], "info", "info"),
+    (Color, "red", Color.RED),
+])
+def test_get_parser_generic(tp, value, expected):
+    parser = get_parser(tp)
+    assert parser(value) == expected
+
+
+@pytest.mark.parametrize("tp", [
+    list,
+    List[int],
+    Dict[str, int],
+    Union[int, str],
+    Tuple[int, int],
+    Optional[List[int]],
+])
+def test_get_parser_unsupported(tp):
+    assert get_parser(tp) is None
+
+
+def test_get_parser_cached():
+    assert get_parser(Optional[int]) is get_parser(Optional[int])
+
+
+def test_register_parser():
+    class Custom:
+        pass
+
+    def parse_custom(value):
+        return value
+
+    assert get_parser(Optional[Custom]) is None
+
+    register_parser(Custom, parse_custom)
+
+    assert get_parser(Custom) is parse_custom
+    assert get_parser(Optional[Custom])("nil") is None
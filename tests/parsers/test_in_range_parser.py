@@ -0,0 +1,23 @@
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import in_range
+
+
+@pytest.mark.parametrize("value", [1, 80, 65535])
+def test_in_range(value):
+    assert in_range(1, 65535)(value) == value
+
+
+@pytest.mark.parametrize("value", [0, 65536, -1])
+def test_not_in_range(value):
+    with raises(Exception) as exc_info:
+        in_range(1, 65535)(value)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to parse {value!r} as value in range [1, 65535]"
+
+
+def test_in_range_repr():
+    assert repr(in_range(0.5, 1.5)) == "in_range(0.5, 1.5)"
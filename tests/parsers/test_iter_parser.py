@@ -0,0 +1,81 @@
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_as_is, parse_int, parse_iter
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("banana", ["banana"]),
+    ("banana,", ["banana"]),
+    ("(banana)", ["banana"]),
+    ("(banana,)", ["banana"]),
+    ("first, second", ["first", "second"]),
+    ("first, second,", ["first", "second"]),
+    ("(first, second)", ["first", "second"]),
+    ("(first, second,)", ["first", "second"]),
+])
+def test_parse_iter(value, expected):
+    assert list(parse_iter(value)) == expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("first second", ["first", "second"]),
+    ("first :: second ::", ["first", "second"]),
+])
+def test_parse_iter_with_separator(value, expected):
+    separator = "::" if "::" in value else " "
+    assert list(parse_iter(value, separator=separator)) == expected
+
+
+def test_parse_iter_with_subparser():
+    assert list(parse_iter("1, 2, 3", subparser=parse_int)) == [1, 2, 3]
+
+
+def test_parse_iter_reiterable():
+    value = parse_iter("1, 2", subparser=parse_int)
+    assert list(value) == [1, 2]
+    assert list(value) == [1, 2]
+
+
+def test_parse_iter_lazy():
+    parsed = []
+
+    def subparser(x):
+        parsed.append(x)
+        return x
+
+    iterator = iter(parse_iter("a,b,c", subparser=subparser))
+    assert parsed == []
+
+    assert next(iterator) == "a"
+    assert parsed == ["a"]
+
+
+def test_parse_empty_iter():
+    with raises(Exception) as exc_info:
+        list(parse_iter(""))
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse item 0: Failed to parse '' as non-empty str"
+
+
+def test_parse_invalid_iter():
+    value = parse_iter("1, 2, banana", subparser=parse_int)
+    iterator = iter(value)
+    assert next(iterator) == 1
+    assert next(iterator) == 2
+
+    with raises(Exception) as exc_info:
+        next(iterator)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse item 2: Failed to parse ' banana' as int"
+
+
+def test_parse_iter_empty_separator():
+    with raises(Exception) as exc_info:
+        parse_iter("abc", separator="", subparser=parse_as_is)
+
+    assert exc_info.type is ValueError
+    assert str(exc_info.value) == "empty separator"
@@ -0,0 +1,97 @@
+import json
+import math
+from types import MappingProxyType
+
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_json
+
+
+def _loads(value):
+    return json.loads(value, parse_float=float)
+
+
+@pytest.fixture(params=[json.loads, _loads], ids=["default", "custom"])
+def loads(request):
+    return request.param
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("42", 42),
+    ('"banana"', "banana"),
+    ("null", None),
+    ("[1, 2]", [1, 2]),
+    ('{"types": ["image/png"]}', {"types": ["image/png"]}),
+])
+def test_parse_json(loads, value, expected):
+    assert parse_json(value, loads=loads) == expected
+
+
+def test_parse_json_mutable(loads):
+    parsed = parse_json('{"types": ["image/png"]}', loads=loads)
+    parsed["types"].append("image/jpeg")
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "banana",
+    '{"key": }',
+])
+def test_parse_invalid_json(loads, value):
+    with raises(Exception) as exc_info:
+        parse_json(value, loads=loads)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to parse {value!r} as JSON"
+
+
+def test_parse_json_freeze(loads):
+    parsed = parse_json('{"types": ["image/png"], "limits": {"size": 1}, "ok": true}',
+                        freeze=True, loads=loads)
+
+    assert isinstance(parsed, MappingProxyType)
+    assert parsed == {"types": ("image/png",), "limits": {"size": 1}, "ok": True}
+    assert isinstance(parsed["limits"], MappingProxyType)
+
+    with raises(TypeError):
+        parsed["ok"] = False
+    with raises(TypeError):
+        parsed["limits"]["size"] = 2
+
+
+def test_parse_json_freeze_structural_sharing(loads):
+    parsed = parse_json('[{"a": [1, true]}, {"a": [1, true]}, [1, 1.0], {"a": [1, 1]}]',
+                        freeze=True, loads=loads)
+
+    assert parsed[0] is parsed[1]
+    assert parsed[0] is not parsed[3]
+    assert parsed[2] == (1, 1.0)
+    assert type(parsed[2][1]) is float
+    assert parsed[3]["a"] == (1, 1)
+
+
+def test_parse_json_custom_loads():
+    calls = []
+
+    def loads(value):
+        calls.append(value)
+        return json.loads(value)
+
+    assert parse_json("[1]", loads=loads) == [1]
+    assert calls == ["[1]"]
+
+
+def test_parse_json_numbers():
+    assert parse_json("123456789012345678901234567890") == 123456789012345678901234567890
+    assert math.isnan(parse_json("NaN"))
+    assert parse_json("[Infinity]") == [math.inf]
+
+
+def test_parse_json_freeze_negative_zero():
+    parsed = parse_json("[0.0, -0.0, 0, 0.0]", freeze=True)
+
+    assert parsed == (0.0, -0.0, 0, 0.0)
+    assert math.copysign(1, parsed[1]) == -1
+    assert type(parsed[2]) is int
@@ -0,0 +1,27 @@
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_literal
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("debug", "debug"),
+    (" info ", "info"),
+    ("1", 1),
+])
+def test_parse_literal(value, expected):
+    assert parse_literal(value, choices=("debug", "info", 1)) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "DEBUG",
+    "warning",
+])
+def test_parse_invalid_literal(value):
+    with raises(Exception) as exc_info:
+        parse_literal(value, choices=("debug", "info"))
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to parse {value!r} as one of ('debug', 'info')"
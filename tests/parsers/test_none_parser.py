@@ -2,7 +2,7 @@ import pytest
 from pytest import raises
 
 from cabina.errors import EnvParseError
-from cabina.parsers import parse_none
+from cabina.parsers import none_parser, parse_none
 
 
 @pytest.mark.parametrize("value", [
@@ -27,3 +27,27 @@ def test_parse_invalid_none(value):
 
     assert exc_info.type is EnvParseError
     assert str(exc_info.value) == f"Failed to parse {value!r} as None"
+
+
+@pytest.mark.parametrize("value", [
+    "undefined",
+    "UNDEFINED",
+    "-",
+    "null",
+])
+def test_none_parser_extended(value):
+    parser = none_parser(values=("Undefined", "-"))
+    assert parser(value) is None
+
+
+def test_none_parser_extended_invalid():
+    parser = none_parser(values=("undefined",))
+
+    with raises(Exception) as exc_info:
+        parser("0")
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse '0' as None"
+
+    with raises(EnvParseError):
+        parse_none("undefined")
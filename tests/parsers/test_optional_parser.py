@@ -0,0 +1,27 @@
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_int, parse_optional
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("none", None),
+    ("Null", None),
+    ("banana ", "banana"),
+])
+def test_parse_optional(value, expected):
+    assert parse_optional(value) == expected
+
+
+def test_parse_optional_with_subparser():
+    assert parse_optional("42", subparser=parse_int) == 42
+    assert parse_optional("nil", subparser=parse_int) is None
+
+
+def test_parse_invalid_optional():
+    with raises(Exception) as exc_info:
+        parse_optional("banana", subparser=parse_int)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse 'banana' as int"
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_path
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("/tmp", Path("/tmp")),
+    (" ./data ", Path("data")),
+])
+def test_parse_path(value, expected):
+    assert parse_path(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "  ",
+])
+def test_parse_invalid_path(value):
+    with raises(Exception) as exc_info:
+        parse_path(value)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to parse {value!r} as path"
@@ -0,0 +1,52 @@
+from functools import partial
+
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import in_range, parse_int, parse_str, parse_tuple, pipe
+
+
+def test_pipe():
+    parser = pipe(parse_str, str.lower, parse_int)
+    assert parser(" 42 ") == 42
+
+
+def test_pipe_empty():
+    parser = pipe()
+    assert parser("banana") == "banana"
+
+
+def test_pipe_flatten():
+    parser = pipe(pipe(parse_str, str.lower), pipe(parse_int, in_range(1, 10)))
+    assert repr(parser) == "pipe(parse_str, lower, parse_int, in_range(1, 10))"
+    assert parser("5") == 5
+
+
+def test_pipe_with_partial():
+    parser = pipe(partial(parse_tuple, subparser=parse_int), sum)
+    assert repr(parser) == "pipe(parse_tuple, sum)"
+    assert parser("1, 2, 3") == 6
+
+
+@pytest.mark.parametrize(("value", "message"), [
+    ("", "Failed to parse '' at parse_str: Failed to parse '' as non-empty str"),
+    ("x", "Failed to parse 'x' at parse_int: Failed to parse 'x' as int"),
+    ("0", "Failed to parse '0' at in_range(1, 65535): "
+          "Failed to parse 0 as value in range [1, 65535]"),
+])
+def test_pipe_invalid(value, message):
+    parser = pipe(parse_str, parse_int, in_range(1, 65535))
+
+    with raises(Exception) as exc_info:
+        parser(value)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == message
+
+
+def test_pipe_other_errors():
+    parser = pipe(parse_str, int)
+
+    with raises(ValueError):
+        parser("x")
@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+import pytest
+from pytest import raises
+
+from cabina.errors import EnvParseError
+from cabina.parsers import parse_timedelta
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ("0", timedelta()),
+    ("10", timedelta(seconds=10)),
+    ("0.5", timedelta(milliseconds=500)),
+])
+def test_parse_timedelta(value, expected):
+    assert parse_timedelta(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "10s",
+    "1e100",
+])
+def test_parse_invalid_timedelta(value):
+    with raises(Exception) as exc_info:
+        parse_timedelta(value)
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == f"Failed to parse {value!r} as timedelta"
@@ -0,0 +1,197 @@
+import io
+
+import cabina
+from cabina import FutureValue, LazyEnvironment, computed
+
+
+def test_config_dump():
+    env = LazyEnvironment({"DB_HOST": "localhost"})
+
+    class Config(cabina.Config, cabina.Section):
+        DEBUG = False
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+
+    stream = io.StringIO()
+    Config.dump(stream)
+
+    assert stream.getvalue() == repr(Config) + "\n"
+
+
+def test_config_dump_redact():
+    env = LazyEnvironment({"DB_HOST": "localhost", "DB_PASSWORD": "secret"})
+
+    class Config(cabina.Config, cabina.Section):
+        DEBUG = False
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+            PASSWORD = env.str("DB_PASSWORD")
+
+            class Pool(cabina.Section):
+                SIZE = 10
+
+        NAMES = ("name-0", "name-1")
+
+    stream = io.StringIO()
+    Config.dump(stream, redact=["*.PASSWORD", "NAMES"])
+
+    assert stream.getvalue() == "\n".join([
+        "class <Config>:",
+        "    DEBUG = False",
+        "",
+        "    class <Db>:",
+        "        HOST = 'localhost'",
+        "        PASSWORD = ***",
+        "",
+        "        class <Pool>:",
+        "            SIZE = 10",
+        "    NAMES = ***",
+        "",
+    ])
+
+
+def test_config_dump_redact_does_not_resolve():
+    calls = []
+
+    def factory():
+        calls.append("factory")
+        return "secret"
+
+    class Config(cabina.Config, cabina.Section):
+        TOKEN = LazyEnvironment({}).str("TOKEN", default_factory=factory)
+
+    Config.dump(io.StringIO(), redact=["TOKEN"])
+    assert calls == []
+
+
+def test_config_dump_max_depth():
+    env = LazyEnvironment({"DB_HOST": "localhost", "DB_PASSWORD": "secret"})
+
+    class Config(cabina.Config, cabina.Section):
+        DEBUG = False
+
+        class Db(cabina.Section):
+            HOST = env.str("DB_HOST")
+            PASSWORD = env.str("DB_PASSWORD")
+
+            class Pool(cabina.Section):
+                SIZE = 10
+
+        NAMES = tuple(f"name-{index}" for index in range(100))
+
+    stream = io.StringIO()
+    Config.dump(stream, max_depth=1, redact=["*.PASSWORD"], max_value_len=11)
+
+    assert stream.getvalue() == "\n".join([
+        "class <Config>:",
+        "    DEBUG = False",
+        "",
+        "    class <Db>:",
+        "        HOST = 'localhost'",
+        "        PASSWORD = ***",
+        "",
+        "        class <Pool>:",
+        "            ...",
+        "    NAMES = ('name-0', ...",
+        "",
+    ])
+
+
+def test_config_dump_max_depth_zero():
+    class Config(cabina.Config, cabina.Section):
+        DEBUG = False
+
+        class Db(cabina.Section):
+            HOST = LazyEnvironment({}).str("DB_HOST")
+
+        NAMES = tuple(f"name-{index}" for index in range(100))
+
+    stream = io.StringIO()
+    Config.dump(stream, max_depth=0, max_value_len=11)
+
+    assert stream.getvalue() == "\n".join([
+        "class <Config>:",
+        "    DEBUG = False",
+        "",
+        "    class <Db>:",
+        "        ...",
+        "    NAMES = ('name-0', ...",
+        "",
+    ])
+
+
+def test_config_dump_writes_lines_lazily():
+    written = []
+
+    class Stream:
+        def write(self, text):
+            written.append(text)
+
+    def factory():
+        assert "".join(written) == "class <Config>:\n    HOST = 'localhost'\n"
+        return 8080
+
+    env = LazyEnvironment({"HOST": "localhost"})
+
+    class Config(cabina.Config, cabina.Section):
+        HOST = env.str("HOST")
+        PORT = env.int("PORT", default_factory=factory)
+
+    Config.dump(Stream())
+    assert "".join(written).endswith("PORT = 8080\n")
+
+
+def test_config_repr_after_fetch():
+    environ = {"HOST": "localhost"}
+    host = LazyEnvironment(environ).str("HOST")
+
+    class Config(cabina.Config, cabina.Section):
+        HOST = host
+
+    assert repr(Config) == "class <Config>:\n    HOST = 'localhost'"
+
+    environ["HOST"] = "127.0.0.1"
+    assert repr(Config) == "class <Config>:\n    HOST = 'localhost'"
+
+    assert isinstance(host, FutureValue)
+    host.fetch()
+    assert repr(Config) == "class <Config>:\n    HOST = '127.0.0.1'"
+
+
+def test_config_repr_after_error():
+    environ = {}
+
+    class Config(cabina.Config, cabina.Section):
+        HOST = LazyEnvironment(environ).str("HOST")
+
+    assert repr(Config) == "class <Config>:\n    HOST = EnvKeyError(\"'HOST' does not exist\")"
+
+    environ["HOST"] = "localhost"
+    assert repr(Config) == "class <Config>:\n    HOST = 'localhost'"
+
+
+def test_config_repr_with_computed():
+    container = [1]
+
+    class Config(cabina.Config, cabina.Section):
+        @computed
+        def VALUE(cls):
+            return container[0]
+
+    assert repr(Config) == "class <Config>:\n    VALUE = 1"
+
+    container[0] = 2
+    assert repr(Config) == "class <Config>:\n    VALUE = 2"
+
+
+def test_config_repr_after_mutation():
+    class Config(cabina.Config):
+        class S(cabina.Section):
+            LIST = [1]
+
+    assert repr(Config) == "class <Config>:\n\n    class <S>:\n        LIST = [1]"
+
+    Config.S.LIST.append(2)
+    assert repr(Config) == "class <Config>:\n\n    class <S>:\n        LIST = [1, 2]"
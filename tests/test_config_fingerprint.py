@@ -0,0 +1,209 @@
+from niltype import Nil
+from pytest import raises
+
+import cabina
+from cabina import LazyEnvironment, computed
+
+
+def test_config_fingerprint():
+    class Config(cabina.Config, cabina.Section):
+        DEBUG = False
+        TAGS = frozenset({"a", "b", "c"})
+
+        class Db(cabina.Section):
+            HOST = LazyEnvironment({}).str("DB_HOST", default="localhost")
+
+    fingerprint = Config.fingerprint()
+    assert isinstance(fingerprint, str)
+    assert len(fingerprint) == 32
+    assert Config.fingerprint() == fingerprint
+
+
+def test_config_fingerprint_equal_values():
+    class Config(cabina.Config, cabina.Section):
+        TAGS = frozenset({"a", "b", "c"})
+
+        class Db(cabina.Section):
+            PORT = LazyEnvironment({}).int("DB_PORT", default=5432)
+
+    class Other(cabina.Config, cabina.Section):
+        TAGS = frozenset({"c", "b", "a"})
+
+        class Db(cabina.Section):
+            PORT = LazyEnvironment({"DB_PORT": "5432"}).int("DB_PORT", default=5432)
+
+    assert Config.fingerprint() == Other.fingerprint()
+    assert Config.Db.fingerprint() == Other.Db.fingerprint()
+
+
+def test_config_fingerprint_different_values():
+    class Config(cabina.Config, cabina.Section):
+        class Db(cabina.Section):
+            PORT = LazyEnvironment({}).int("DB_PORT", default=5432)
+
+        class Cache(cabina.Section):
+            URL = "redis://localhost"
+
+    class Other(cabina.Config, cabina.Section):
+        class Db(cabina.Section):
+            PORT = LazyEnvironment({"DB_PORT": "6432"}).int("DB_PORT", default=5432)
+
+        class Cache(cabina.Section):
+            URL = "redis://localhost"
+
+    assert Config.fingerprint() != Other.fingerprint()
+    assert Config.Db.fingerprint() != Other.Db.fingerprint()
+    assert Config.Cache.fingerprint() == Other.Cache.fingerprint()
+
+
+def test_config_fingerprint_different_keys():
+    class First(cabina.Section):
+        HOST = "localhost"
+
+    class Second(cabina.Section):
+        ADDR = "localhost"
+
+    assert First.fingerprint() != Second.fingerprint()
+
+
+def test_config_fingerprint_invalidated_on_fetch():
+    environ = {"DB_PORT": "5432"}
+    env = LazyEnvironment(environ)
+
+    class Config(cabina.Config, cabina.Section):
+        class Db(cabina.Section):
+            PORT = env.int("DB_PORT")
+
+    fingerprint = Config.fingerprint()
+
+    environ["DB_PORT"] = "6432"
+    assert Config.fingerprint() == fingerprint
+
+    Config.Db.__dict__["PORT"].fetch()
+    assert Config.fingerprint() != fingerprint
+
+
+def test_config_fingerprint_computed():
+    container = [1]
+
+    class Config(cabina.Config, cabina.Section):
+        @computed
+        def VALUE(cls):
+            return container[0]
+
+    fingerprint = Config.fingerprint()
+
+    container[0] = 2
+    assert Config.fingerprint() != fingerprint
+
+
+def test_config_diff():
+    class Config(cabina.Config, cabina.Section):
+        DEBUG = False
+
+        class Db(cabina.Section):
+            HOST = "localhost"
+            PORT = 5432
+
+            class Pool(cabina.Section):
+                SIZE = 10
+
+    class Other(cabina.Config, cabina.Section):
+        DEBUG = True
+
+        class Db(cabina.Section):
+            HOST = "localhost"
+            PORT = 6432
+
+            class Pool(cabina.Section):
+                SIZE = 10
+
+    assert Config.diff(Other) == {
+        "DEBUG": (False, True),
+        "Db.PORT": (5432, 6432),
+    }
+    assert Config.diff(Config) == {}
+
+
+def test_config_diff_skips_equal_sections():
+    calls = []
+
+    class Counted:
+        def __repr__(self):
+            calls.append("repr")
+            return "Counted()"
+
+    class Config(cabina.Config, cabina.Section):
+        DEBUG = False
+
+        class Nested(cabina.Section):
+            VALUE = Counted()
+
+    class Other(cabina.Config, cabina.Section):
+        DEBUG = True
+
+        class Nested(cabina.Section):
+            VALUE = Counted()
+
+    assert Config.diff(Other) == {"DEBUG": (False, True)}
+    assert calls == ["repr", "repr"]
+
+
+def test_config_diff_missing_members():
+    class Config(cabina.Config, cabina.Section):
+        HOST = "localhost"
+
+        class Db(cabina.Section):
+            pass
+
+    class Other(cabina.Config, cabina.Section):
+        PORT = 8080
+        Db = 1
+
+    assert Config.diff(Other) == {
+        "HOST": ("localhost", Nil),
+        "Db": (Config.Db, 1),
+        "PORT": (Nil, 8080),
+    }
+
+
+def test_config_fingerprint_iter_values():
+    class Config(cabina.Config, cabina.Section):
+        HOSTS = LazyEnvironment({"HOSTS": "a,b"}).iter("HOSTS")
+
+    class Other(cabina.Config, cabina.Section):
+        HOSTS = LazyEnvironment({"HOSTS": "x,y,z"}).iter("HOSTS")
+
+    assert Config.fingerprint() != Other.fingerprint()
+    assert list(Config.diff(Other)) == ["HOSTS"]
+
+
+def test_config_fingerprint_binary_values():
+    env = LazyEnvironment({"KEY": "00ff", "SIZES": "1,2"})
+
+    class Config(cabina.Config, cabina.Section):
+        KEY = env.bytes("KEY", encoding="hex", view=True)
+        SIZES = env.array("SIZES", typecode="i")
+
+    class Other(cabina.Config, cabina.Section):
+        KEY = env.bytes("KEY", encoding="hex", view=True)
+        SIZES = env.array("SIZES", typecode="i")
+
+    class Changed(cabina.Config, cabina.Section):
+        KEY = b"\x00\xfe"
+        SIZES = env.array("SIZES", typecode="i")
+
+    assert Config.fingerprint() == Other.fingerprint()
+    assert Config.diff(Other) == {}
+    assert list(Config.diff(Changed)) == ["KEY"]
+
+
+def test_config_fingerprint_address_repr():
+    class Config(cabina.Config, cabina.Section):
+        HANDLER = object()
+
+    with raises(Exception) as exc_info:
+        Config.fingerprint()
+
+    assert exc_info.type is TypeError
+    assert str(exc_info.value).startswith("Failed to represent <object object at 0x")
@@ -0,0 +1,96 @@
+from pytest import raises
+
+import cabina
+from cabina import LazyEnvironment
+from cabina.errors import ConfigKeyError, EnvKeyError
+
+
+def test_config_paths():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config):
+        class Main(cabina.Section):
+            DEBUG = False
+
+            class Db(cabina.Section):
+                HOST = env.str("DB_HOST")
+                PORT = env.int("DB_PORT")
+
+    assert list(Config.paths()) == [
+        "Main",
+        "Main.DEBUG",
+        "Main.Db",
+        "Main.Db.HOST",
+        "Main.Db.PORT",
+    ]
+    assert list(Config.Main.Db.paths()) == ["HOST", "PORT"]
+
+
+def test_config_get_path():
+    env = LazyEnvironment({"DB_HOST": "localhost"})
+
+    class Config(cabina.Config):
+        class Main(cabina.Section):
+            DEBUG = False
+
+            class Db(cabina.Section):
+                HOST = env.str("DB_HOST")
+
+    assert Config.get_path("Main.Db.HOST") == "localhost"
+    assert Config.get_path("Main.DEBUG") is False
+    assert Config.get_path("Main.Db") is Config.Main.Db
+    assert Config.Main.get_path("Db.HOST") == "localhost"
+
+
+def test_config_get_path_default():
+    env = LazyEnvironment({"DB_HOST": "localhost"})
+
+    class Config(cabina.Config):
+        class Main(cabina.Section):
+            class Db(cabina.Section):
+                HOST = env.str("DB_HOST")
+
+    assert Config.get_path("Main.Db.USER", None) is None
+    assert Config.get_path("Main.Db.HOST", default="127.0.0.1") == "localhost"
+
+
+def test_config_get_path_nonexisting():
+    class Config(cabina.Config):
+        class Main(cabina.Section):
+            class Db(cabina.Section):
+                HOST = "localhost"
+
+    with raises(Exception) as exc_info:
+        Config.get_path("Main.Db.USER")
+
+    assert exc_info.type is ConfigKeyError
+    assert str(exc_info.value) == "'Main.Db.USER' does not exist in <Config>"
+
+
+def test_config_get_path_unresolved_value():
+    env = LazyEnvironment({})
+
+    class Config(cabina.Config):
+        class Main(cabina.Section):
+            class Db(cabina.Section):
+                PORT = env.int("DB_PORT")
+
+    with raises(Exception) as exc_info:
+        Config.get_path("Main.Db.PORT", default=5432)
+
+    assert exc_info.type is EnvKeyError
+    assert str(exc_info.value) == "'DB_PORT' does not exist"
+
+
+def test_config_get_path_inheritance():
+    class Base(cabina.Section):
+        HOST = "localhost"
+        PORT = 5432
+
+    class Config(cabina.Config, cabina.Section):
+        class Db(Base):
+            PORT = 6432
+
+    assert list(Config.paths()) == ["Db", "Db.HOST", "Db.PORT"]
+    assert Config.get_path("Db.HOST") == "localhost"
+    assert Config.get_path("Db.PORT") == 6432
@@ -0,0 +1,94 @@
+import sys
+
+import cabina
+from cabina import FutureValue, LazyEnvironment
+from cabina.errors import EnvKeyError
+
+
+def test_config_walk():
+    env = LazyEnvironment({"HOST": "localhost"})
+
+    class Config(cabina.Config, cabina.Section):
+        DEBUG = False
+
+        class Db(cabina.Section):
+            HOST = env.str("HOST")
+
+            class Pool(cabina.Section):
+                SIZE = 10
+
+        TZ = "UTC"
+
+    walked = list(Config.walk())
+
+    assert [(path, key) for path, key, _ in walked] == [
+        ("", "DEBUG"),
+        ("", "Db"),
+        ("Db", "HOST"),
+        ("Db", "Pool"),
+        ("Db.Pool", "SIZE"),
+        ("", "TZ"),
+    ]
+    assert walked[1][2] is Config.Db
+    assert isinstance(walked[2][2], FutureValue)
+
+
+def test_config_walk_resolve():
+    env = LazyEnvironment({"HOST": "localhost"})
+
+    class Config(cabina.Config, cabina.Section):
+        HOST = env.str("HOST")
+        PORT = env.int("PORT")
+
+        class Main(cabina.Section):
+            DEBUG = True
+
+    walked = list(Config.walk(resolve=True))
+
+    assert walked[0] == ("", "HOST", "localhost")
+    assert walked[1][:2] == ("", "PORT")
+    assert isinstance(walked[1][2], EnvKeyError)
+    assert walked[2:] == [("", "Main", Config.Main), ("Main", "DEBUG", True)]
+
+
+def test_config_walk_is_lazy():
+    calls = []
+
+    def factory():
+        calls.append("factory")
+        return "localhost"
+
+    class Config(cabina.Config, cabina.Section):
+        HOST = LazyEnvironment({}).str("HOST", default_factory=factory)
+        PORT = LazyEnvironment({}).int("PORT", default_factory=lambda: 80)
+
+    walker = Config.walk(resolve=True)
+    assert calls == []
+
+    assert next(walker) == ("", "HOST", "localhost")
+    assert calls == ["factory"]
+
+
+def test_config_walk_inherited_members():
+    class Base(cabina.Section):
+        HOST = "localhost"
+
+    class Config(cabina.Config, Base):
+        PORT = 8080
+
+    assert list(Config.walk()) == [("", "HOST", "localhost"), ("", "PORT", 8080)]
+
+
+def test_config_walk_deeply_nested():
+    depth = sys.getrecursionlimit() + 100
+
+    section = type("Section0", (cabina.Section,), {"VALUE": 0})
+    for index in range(1, depth):
+        section = type(f"Section{index}", (cabina.Section,), {"Child": section})
+    Config = type("Config", (cabina.Config,), {"Child": section})
+
+    walked = list(Config.walk())
+
+    assert len(walked) == depth + 1
+    assert walked[-1] == (".".join(["Child"] * depth), "VALUE", 0)
+    assert repr(Config).endswith("VALUE = 0")
@@ -0,0 +1,34 @@
+from cabina._env_index import EnvIndex
+
+
+def test_env_index_find():
+    index = EnvIndex({"B_1": "", "A_1": "", "A_2": "", "AB": "", "A": "", "C": ""})
+
+    assert index.find("A_") == ("A_1", "A_2")
+    assert index.find("A") == ("A", "AB", "A_1", "A_2")
+    assert index.find("D") == ()
+    assert index.find("") == ("A", "AB", "A_1", "A_2", "B_1", "C")
+
+
+def test_env_index_find_cached():
+    index = EnvIndex({"A_1": ""})
+    assert index.find("A_") is index.find("A_")
+
+
+def test_env_index_is_stale():
+    environ = {"A_1": ""}
+    index = EnvIndex(environ)
+    assert len(index) == 1
+    assert not index.is_stale(environ)
+
+    environ["A_2"] = ""
+    assert index.is_stale(environ)
+
+
+def test_env_index_is_stale_replaced_name():
+    environ = {"A": "", "FEATURE_X": ""}
+    index = EnvIndex(environ)
+
+    del environ["A"]
+    environ["FEATURE_Y"] = ""
+    assert not index.is_stale(environ)
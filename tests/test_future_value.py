@@ -1,4 +1,4 @@
-from cabina import FutureValue
+from cabina import FutureValue, combine
 
 
 def test_future_value():
@@ -81,3 +81,89 @@ def test_future_value_repr():
     # args & kwargs
     assert (repr(FutureValue(accessor, "arg", default="val")) ==
             "FutureValue('arg', default='val')")
+
+
+def test_future_value_convert():
+    values = iter(["1", "2"])
+    value = FutureValue(lambda: next(values))
+    assert value.get() == "1"
+
+    value.convert(int)
+    assert value.get() == 2
+    assert repr(value) == "FutureValue()"
+
+
+def test_future_value_map():
+    value = FutureValue(lambda: 8080).map(lambda port: ("localhost", port))
+    assert value.get() == ("localhost", 8080)
+
+
+def test_future_value_map_evaluates_once():
+    calls = []
+
+    def accessor():
+        calls.append("accessor")
+        return 1
+
+    def fn(x):
+        calls.append("fn")
+        return x + 1
+
+    source = FutureValue(accessor)
+    value = source.map(fn)
+    assert calls == []
+
+    assert value.get() == 2
+    assert value.get() == 2
+    assert source.get() == 1
+    assert calls == ["accessor", "fn"]
+
+
+def test_future_value_map_chain():
+    value = FutureValue(lambda: "8080").map(int).map(lambda x: x + 1)
+    assert value.get() == 8081
+
+
+def test_future_value_map_refetch():
+    values = iter([1, 2])
+    source = FutureValue(lambda: next(values))
+    value = source.map(lambda x: x * 10).map(lambda x: x + 1)
+    assert value.get() == 11
+
+    assert source.fetch() == 2
+    assert value.get() == 21
+    assert value.get() == 21
+
+
+def test_combine_refetch():
+    hosts = iter(["localhost", "db.local"])
+    host = FutureValue(lambda: next(hosts))
+    value = combine(host, 8080, lambda host, port: f"{host}:{port}")
+    assert value.get() == "localhost:8080"
+
+    host.fetch()
+    assert value.get() == "db.local:8080"
+
+
+def test_combine():
+    value = combine(FutureValue(lambda: "localhost"), FutureValue(lambda: 8080),
+                    lambda host, port: f"{host}:{port}")
+    assert value.get() == "localhost:8080"
+
+
+def test_combine_with_plain_value():
+    value = combine("localhost", FutureValue(lambda: 8080), lambda host, port: (host, port))
+    assert value.get() == ("localhost", 8080)
+
+
+def test_combine_evaluates_once():
+    calls = []
+
+    def fn(a, b):
+        calls.append((a, b))
+        return a + b
+
+    value = combine(FutureValue(lambda: 1), FutureValue(lambda: 2), fn)
+    assert value.get() == 3
+    assert value.get() == 3
+    assert calls == [(1, 2)]
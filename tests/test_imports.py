@@ -86,6 +86,18 @@ def test_import_future_value():
     from cabina import FutureValue
 
 
+def test_import_combine():
+    from cabina import combine
+
+
+def test_import_frozen_section():
+    from cabina import FrozenSection
+
+
+def test_import_provenance():
+    from cabina import Provenance
+
+
 def test_import_value_type():
     from cabina import ValueType
 
@@ -130,3 +142,129 @@ def test_import_parser_parse_tuple():
     from cabina.parsers import parse_tuple
     with raises(ImportError):
         from cabina import parse_tuple
+
+
+def test_import_parser_parse_optional():
+    from cabina.parsers import parse_optional
+    with raises(ImportError):
+        from cabina import parse_optional
+
+
+def test_import_parser_parse_literal():
+    from cabina.parsers import parse_literal
+    with raises(ImportError):
+        from cabina import parse_literal
+
+
+def test_import_parser_parse_enum():
+    from cabina.parsers import parse_enum
+    with raises(ImportError):
+        from cabina import parse_enum
+
+
+def test_import_parser_parse_path():
+    from cabina.parsers import parse_path
+    with raises(ImportError):
+        from cabina import parse_path
+
+
+def test_import_parser_parse_timedelta():
+    from cabina.parsers import parse_timedelta
+    with raises(ImportError):
+        from cabina import parse_timedelta
+
+
+def test_import_get_parser():
+    from cabina.parsers import get_parser
+    with raises(ImportError):
+        from cabina import get_parser
+
+
+def test_import_register_parser():
+    from cabina.parsers import register_parser
+    with raises(ImportError):
+        from cabina import register_parser
+
+
+def test_import_parser_pipe():
+    from cabina.parsers import pipe
+    with raises(ImportError):
+        from cabina import pipe
+
+
+def test_import_parser_in_range():
+    from cabina.parsers import in_range
+    with raises(ImportError):
+        from cabina import in_range
+
+
+def test_import_parser_none_parser():
+    from cabina.parsers import none_parser
+    with raises(ImportError):
+        from cabina import none_parser
+
+
+def test_import_parser_bool_parser():
+    from cabina.parsers import bool_parser
+    with raises(ImportError):
+        from cabina import bool_parser
+
+
+def test_import_parser_parse_iter():
+    from cabina.parsers import parse_iter
+    with raises(ImportError):
+        from cabina import parse_iter
+
+
+def test_import_parser_parse_frozenset():
+    from cabina.parsers import parse_frozenset
+    with raises(ImportError):
+        from cabina import parse_frozenset
+
+
+def test_import_parser_parse_array():
+    from cabina.parsers import parse_array
+    with raises(ImportError):
+        from cabina import parse_array
+
+
+def test_import_parser_parse_bytes():
+    from cabina.parsers import parse_bytes
+    with raises(ImportError):
+        from cabina import parse_bytes
+
+
+def test_import_parser_parse_file():
+    from cabina.parsers import parse_file
+    with raises(ImportError):
+        from cabina import parse_file
+
+
+def test_import_parser_parse_json():
+    from cabina.parsers import parse_json
+    with raises(ImportError):
+        from cabina import parse_json
+
+
+def test_import_parser_parse_duration():
+    from cabina.parsers import parse_duration
+    with raises(ImportError):
+        from cabina import parse_duration
+
+
+def test_import_parser_parse_bytesize():
+    from cabina.parsers import parse_bytesize
+    with raises(ImportError):
+        from cabina import parse_bytesize
+
+
+def test_import_parser_parse_dsn():
+    from cabina.parsers import parse_dsn
+    with raises(ImportError):
+        from cabina import parse_dsn
+
+
+def test_import_dsn():
+    from cabina.parsers import Dsn
+    with raises(ImportError):
+        from cabina import Dsn
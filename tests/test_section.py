@@ -5,7 +5,7 @@ from pytest import raises
 
 import cabina
 from cabina import computed
-from cabina.errors import ConfigAttrError, ConfigError, ConfigKeyError
+from cabina.errors import ConfigAttrError, ConfigError, ConfigKeyError, EnvKeyError
 
 
 def test_section():
@@ -204,6 +204,95 @@ def test_section_items():
     ]
 
 
+def test_section_values_lazy():
+    calls = []
+
+    def factory():
+        calls.append("factory")
+        return 8080
+
+    class Section(cabina.Section):
+        API_HOST = "localhost"
+        API_PORT = cabina.LazyEnvironment({}).int("PORT", default_factory=factory)
+
+    values = iter(Section.values())
+    assert next(values) == "localhost"
+    assert calls == []
+
+    assert next(values) == 8080
+    assert calls == ["factory"]
+
+
+def test_section_values_contains():
+    class Section(cabina.Section):
+        API_HOST = "localhost"
+        API_PORT = 8080
+
+    assert 8080 in Section.values()
+    assert "banana" not in Section.values()
+    assert len(Section.values()) == 2
+
+
+def test_section_values_raw():
+    class Section(cabina.Section):
+        API_HOST = "localhost"
+        API_PORT = cabina.LazyEnvironment({}).int("PORT")
+
+    values = list(Section.values(resolve=False))
+    assert values[0] == "localhost"
+    assert isinstance(values[1], cabina.FutureValue)
+
+
+def test_section_items_lazy():
+    class Section(cabina.Section):
+        API_HOST = "localhost"
+        API_PORT = cabina.LazyEnvironment({}).int("PORT")
+
+    items = iter(Section.items())
+    assert next(items) == ("API_HOST", "localhost")
+
+    key, value = next(items)
+    assert key == "API_PORT"
+    assert isinstance(value, EnvKeyError)
+
+
+def test_section_items_contains():
+    class Section(cabina.Section):
+        API_HOST = "localhost"
+        API_PORT = cabina.LazyEnvironment({}).int("PORT")
+
+    assert ("API_HOST", "localhost") in Section.items()
+    assert ("API_HOST", "127.0.0.1") not in Section.items()
+    assert ("banana", "localhost") not in Section.items()
+    assert "API_HOST" not in Section.items()
+    assert len(Section.items()) == 2
+
+
+def test_section_items_raw():
+    container = [1]
+
+    class Section(cabina.Section):
+        API_PORT = cabina.LazyEnvironment({}).int("PORT")
+
+        @computed
+        def VALUE(cls):
+            container.append(2)
+            return container[0]
+
+    items = dict(Section.items(resolve=False))
+    assert isinstance(items["API_PORT"], cabina.FutureValue)
+    assert isinstance(items["VALUE"], computed)
+    assert container == [1]
+
+
+def test_section_items_repr():
+    class Section(cabina.Section):
+        API_PORT = cabina.LazyEnvironment({}).int("PORT")
+
+    assert repr(Section.items()) == "SectionItemsView(<Section>)"
+    assert repr(Section.values()) == "SectionValuesView(<Section>)"
+
+
 def test_section_get():
     class Section(cabina.Section):
         API_HOST = "localhost"
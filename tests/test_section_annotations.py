@@ -0,0 +1,174 @@
+from datetime import timedelta
+from enum import Enum
+from pathlib import Path
+from typing import List, Literal, Optional, Tuple
+
+from pytest import raises
+
+import cabina
+from cabina import Environment, LazyEnvironment, computed
+from cabina.errors import ConfigEnvError, ConfigError, EnvParseError
+
+
+class Level(Enum):
+    DEBUG = "debug"
+    INFO = "info"
+
+
+def test_section_annotations_raw_env():
+    env = Environment({
+        "PORT": "8080",
+        "DEBUG": "yes",
+        "TIMEOUT": "1.5",
+        "HOSTS": "a, b",
+        "LEVEL": "info",
+        "MODE": "fast",
+        "ROOT": "/tmp",
+        "RETRY": "none",
+    })
+
+    class Section(cabina.Section):
+        PORT: int = env("PORT")
+        DEBUG: bool = env("DEBUG")
+        TIMEOUT: timedelta = env("TIMEOUT")
+        HOSTS: Tuple[str, ...] = env("HOSTS")
+        LEVEL: Level = env("LEVEL")
+        MODE: Literal["fast", "slow"] = env("MODE")
+        ROOT: Path = env("ROOT")
+        RETRY: Optional[int] = env("RETRY")
+
+    assert Section.PORT == 8080
+    assert Section.DEBUG is True
+    assert Section.TIMEOUT == timedelta(seconds=1.5)
+    assert Section.HOSTS == ("a", "b")
+    assert Section.LEVEL is Level.INFO
+    assert Section.MODE == "fast"
+    assert Section.ROOT == Path("/tmp")
+    assert Section.RETRY is None
+
+
+def test_section_annotations_defaults():
+    class Section(cabina.Section):
+        PORT: int = 8080
+        TIMEOUT: float = 10
+        ROOT: Path = "/tmp"
+        HOST: str = " localhost "
+
+    assert Section.PORT == 8080
+    assert Section.TIMEOUT == 10
+    assert Section.ROOT == Path("/tmp")
+    assert Section.HOST == " localhost "
+
+
+def test_section_annotations_lazy_env():
+    environ = {}
+    env = LazyEnvironment(environ)
+
+    class Section(cabina.Section):
+        PORT: int = env("PORT")
+        DEBUG: bool = env("DEBUG", default=False)
+
+    environ["PORT"] = "8080"
+
+    assert Section.PORT == 8080
+    assert Section.DEBUG is False
+
+
+def test_section_annotations_lazy_env_fetch():
+    environ = {"PORT": "8080"}
+    env = LazyEnvironment(environ)
+
+    class Section(cabina.Section):
+        PORT: int = env("PORT")
+
+    assert Section.PORT == 8080
+    assert repr(Section.__dict__["PORT"]) == "FutureValue('PORT')"
+
+    environ["PORT"] = "9090"
+    assert Section.__dict__["PORT"].fetch() == 9090
+    assert Section.PORT == 9090
+
+
+def test_section_annotations_lazy_env_prefetch():
+    env = LazyEnvironment({"PORT": "number"})
+
+    class Config(cabina.Config, cabina.Section):
+        PORT: int = env("PORT")
+
+    with raises(Exception) as exc_info:
+        Config.prefetch()
+
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == "\n".join([
+        "Failed to prefetch:",
+        "- Config.PORT: Failed to parse 'number' as int",
+    ])
+
+
+def test_section_annotations_lazy_env_mismatch():
+    env = LazyEnvironment({"PORT": '{"port": 8080}'})
+
+    class Config(cabina.Config, cabina.Section):
+        PORT: int = env.json("PORT")
+        RETRY: Optional[int] = env("RETRY", default=None)
+
+    with raises(Exception) as exc_info:
+        Config.prefetch()
+
+    assert exc_info.type is ConfigEnvError
+    assert str(exc_info.value) == "\n".join([
+        "Failed to prefetch:",
+        "- Config.PORT: Expected int, got {'port': 8080}",
+    ])
+    assert Config.RETRY is None
+
+
+def test_section_annotations_invalid_raw_value():
+    env = Environment({"PORT": "number"})
+
+    with raises(Exception) as exc_info:
+        class Section(cabina.Section):
+            PORT: int = env("PORT")
+
+    assert exc_info.type is EnvParseError
+    assert str(exc_info.value) == "Failed to parse 'number' as int"
+
+
+def test_section_annotations_mismatch():
+    with raises(Exception) as exc_info:
+        class Section(cabina.Section):
+            DEBUG: bool = 1
+
+    assert exc_info.type is ConfigError
+    assert str(exc_info.value) == "Attempted to assign 1 to 'DEBUG' of type bool in <Section>"
+
+
+def test_section_annotations_generic_mismatch():
+    with raises(Exception) as exc_info:
+        class Section(cabina.Section):
+            RETRY: Optional[int] = 1.5
+
+    assert exc_info.type is ConfigError
+    assert str(exc_info.value) == ("Attempted to assign 1.5 to 'RETRY' of type "
+                                   "typing.Optional[int] in <Section>")
+
+
+def test_section_annotations_unsupported():
+    class Section(cabina.Section):
+        HOSTS: List[str] = ("a", "b")
+        NAME: "UndefinedType" = 42  # noqa: F821
+
+        @computed
+        def URL(cls) -> str:
+            return "http://localhost"
+
+    assert Section.HOSTS == ("a", "b")
+    assert Section.NAME == 42
+    assert Section.URL == "http://localhost"
+
+
+def test_section_annotations_postponed():
+    class Section(cabina.Section):
+        PORT: "int" = "8080"
+
+    assert Section.PORT == 8080
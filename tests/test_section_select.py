@@ -0,0 +1,93 @@
+from pytest import raises
+
+import cabina
+from cabina import LazyEnvironment, computed
+from cabina.errors import ConfigKeyError, EnvKeyError
+
+
+def test_section_select():
+    env = LazyEnvironment({"HOST": "localhost", "PORT": "5432"})
+
+    class Db(cabina.Section):
+        HOST = env.str("HOST")
+        PORT = env.int("PORT")
+        USER = "admin"
+
+    assert Db.select("HOST", "PORT", "USER") == ("localhost", 5432, "admin")
+    assert Db.select("USER", "HOST") == ("admin", "localhost")
+    assert Db.select() == ()
+
+
+def test_section_select_cached():
+    class Db(cabina.Section):
+        HOST = LazyEnvironment({"HOST": "localhost"}).str("HOST")
+        PORT = 5432
+
+    assert Db.select("HOST", "PORT") is Db.select("HOST", "PORT")
+
+
+def test_section_select_cache_invalidated_on_fetch():
+    environ = {"HOST": "localhost"}
+    host = LazyEnvironment(environ).str("HOST")
+
+    class Db(cabina.Section):
+        HOST = host
+
+    assert Db.select("HOST") == ("localhost",)
+
+    environ["HOST"] = "127.0.0.1"
+    host.fetch()
+    assert Db.select("HOST") == ("127.0.0.1",)
+
+
+def test_section_select_computed():
+    container = [1]
+
+    class Section(cabina.Section):
+        DEBUG = False
+
+        @computed
+        def VALUE(cls):
+            return container[0]
+
+    assert Section.select("DEBUG", "VALUE") == (False, 1)
+
+    container[0] = 2
+    assert Section.select("DEBUG", "VALUE") == (False, 2)
+
+
+def test_section_select_inherited():
+    class Base(cabina.Section):
+        HOST = "localhost"
+
+    class Db(Base):
+        PORT = 5432
+
+    assert Db.select("PORT", "HOST") == (5432, "localhost")
+
+
+def test_section_select_nonexisting_key():
+    class Db(cabina.Section):
+        HOST = "localhost"
+
+    with raises(Exception) as exc_info:
+        Db.select("HOST", "PORT")
+
+    assert exc_info.type is ConfigKeyError
+    assert str(exc_info.value) == "'PORT' does not exist in <Db>"
+
+
+def test_section_select_unresolved_value():
+    environ = {}
+
+    class Db(cabina.Section):
+        HOST = LazyEnvironment(environ).str("HOST")
+
+    with raises(Exception) as exc_info:
+        Db.select("HOST")
+
+    assert exc_info.type is EnvKeyError
+    assert str(exc_info.value) == "'HOST' does not exist"
+
+    environ["HOST"] = "localhost"
+    assert Db.select("HOST") == ("localhost",)